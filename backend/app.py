@@ -17,7 +17,8 @@ from utils.ocr_processor import (
     translate_with_mymemory,
     translate_with_googletrans,
     compare_documents,
-    perform_ocr_with_lang_detect
+    perform_ocr_with_lang_detect,
+    detect_language
 )
 from utils.gemini_client import GeminiClient
 
@@ -214,8 +215,7 @@ def translate_document():
         # Determine source language if not provided
         if source_language_code == 'auto':
             try:
-                from langdetect import detect
-                source_language_code = detect(text[:1000])
+                source_language_code = detect_language(text[:1000])
                 app.logger.info(f"Auto-detected source language: {source_language_code}")
             except Exception as e:
                 app.logger.warning(f"Auto-detection of source language failed: {e}. Defaulting to English.")
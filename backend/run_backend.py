@@ -14,6 +14,10 @@ sys.path.insert(0, current_dir)
 # Now import and run the Flask app
 from app import app
 
+# The debug reloader re-runs this script in a child process, importing the whole
+# OCR stack a second time; launchers that don't need live reload can turn it off
+USE_RELOADER = os.getenv('BACKEND_RELOAD', 'true').lower() == 'true'
+
 if __name__ == '__main__':
     print(">> Starting OCR Legal Document Processor Backend...")
     print(">> Backend will be available at: http://localhost:5000")
@@ -24,6 +28,7 @@ if __name__ == '__main__':
     # Run the Flask development server
     app.run(
         debug=True,
+        use_reloader=USE_RELOADER,
         host='0.0.0.0',
         port=5000,
         threaded=True
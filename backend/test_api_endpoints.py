@@ -6,9 +6,12 @@ from pathlib import Path
 BASE_URL = "http://localhost:5000"
 SAMPLE_FILES_DIR = Path("tests/sample_files")
 
+# Shared keep-alive connection to the dev server for every request in this run
+SESSION = requests.Session()
+
 def test_health():
     print("\n🔍 Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}")
     assert response.status_code == 200
@@ -34,7 +37,7 @@ def test_ocr():
         print(f"\nTesting with {file_name}...")
         with open(file_path, "rb") as f:
             files = {"file": (file_name, f)}
-            response = requests.post(f"{BASE_URL}/ocr", files=files)
+            response = SESSION.post(f"{BASE_URL}/ocr", files=files)
             print(f"Status: {response.status_code}")
             print(f"Response: {json.dumps(response.json(), indent=2)}")
             assert response.status_code == 200
@@ -55,7 +58,7 @@ def test_translation():
             "text": text,
             "target_language": target_lang
         }
-        response = requests.post(f"{BASE_URL}/translate", json=data)
+        response = SESSION.post(f"{BASE_URL}/translate", json=data)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         assert response.status_code == 200
@@ -68,7 +71,7 @@ def test_cleanup():
     and line   breaks."""
     
     data = {"text": test_text}
-    response = requests.post(f"{BASE_URL}/cleanup", json=data)
+    response = SESSION.post(f"{BASE_URL}/cleanup", json=data)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     assert response.status_code == 200
@@ -82,7 +85,7 @@ def test_summarize():
     The system is built with security in mind and supports various authentication methods."""
     
     data = {"text": test_text}
-    response = requests.post(f"{BASE_URL}/summarize", json=data)
+    response = SESSION.post(f"{BASE_URL}/summarize", json=data)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     assert response.status_code == 200
@@ -98,7 +101,7 @@ def test_bullet_points():
     5. Security features and authentication"""
     
     data = {"text": test_text}
-    response = requests.post(f"{BASE_URL}/bullet_points", json=data)
+    response = SESSION.post(f"{BASE_URL}/bullet_points", json=data)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     assert response.status_code == 200
@@ -113,7 +116,7 @@ def test_document_comparison():
         "text1": text1,
         "text2": text2
     }
-    response = requests.post(f"{BASE_URL}/compare", json=data)
+    response = SESSION.post(f"{BASE_URL}/compare", json=data)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     assert response.status_code == 200
@@ -15,10 +15,30 @@ from pathlib import Path
 # Add the backend directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+HEALTH_URL = 'http://localhost:5000/health'
+SERVER_READY_TIMEOUT = 20
+
+# Shared keep-alive connection to the dev server for every request in this run
+SESSION = requests.Session()
+
+def wait_ready(url=HEALTH_URL, timeout=SERVER_READY_TIMEOUT):
+    """Poll the health endpoint with backoff; True as soon as it answers 200"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            if SESSION.get(url, timeout=0.5).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
+    return False
+
 def test_health_endpoint():
     """Test the health check endpoint"""
     try:
-        response = requests.get('http://localhost:5000/health', timeout=5)
+        response = SESSION.get(HEALTH_URL, timeout=5)
         if response.status_code == 200:
             data = response.json()
             print("✅ Health check passed:", data)
@@ -52,7 +72,7 @@ def test_file_upload():
             # Test upload
             with open(temp_path, 'rb') as f:
                 files = {'file': (filename, f, content_type)}
-                response = requests.post('http://localhost:5000/api/process', files=files, timeout=30)
+                response = SESSION.post('http://localhost:5000/api/process', files=files, timeout=30)
             
             # Clean up
             os.unlink(temp_path)
@@ -89,7 +109,7 @@ def test_translation_api():
     results = []
     for test_case in test_cases:
         try:
-            response = requests.post(
+            response = SESSION.post(
                 'http://localhost:5000/api/translate',
                 json=test_case,
                 headers={'Content-Type': 'application/json'},
@@ -131,7 +151,7 @@ def test_text_processing_apis():
     
     for endpoint in endpoints:
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f'http://localhost:5000/{endpoint}',
                 json={'text': test_text},
                 headers={'Content-Type': 'application/json'},
@@ -185,7 +205,7 @@ def test_document_comparison():
     results = []
     for i, test_case in enumerate(test_cases):
         try:
-            response = requests.post(
+            response = SESSION.post(
                 'http://localhost:5000/api/compare',
                 json={'text1': test_case['text1'], 'text2': test_case['text2']},
                 headers={'Content-Type': 'application/json'},
@@ -256,9 +276,9 @@ def test_error_handling():
         try:
             if test['method'] == 'POST':
                 if 'json' in test:
-                    response = requests.post(test['url'], json=test.get('json'), timeout=10)
+                    response = SESSION.post(test['url'], json=test.get('json'), timeout=10)
                 else:
-                    response = requests.post(test['url'], data=test.get('data'), timeout=10)
+                    response = SESSION.post(test['url'], data=test.get('data'), timeout=10)
             
             if response.status_code == test['expected_status']:
                 print(f"✅ {test['name']}: Correctly returned status {response.status_code}")
@@ -280,16 +300,9 @@ def main():
     
     # Wait for server to be ready
     print("⏳ Waiting for server to be ready...")
-    max_retries = 10
-    for i in range(max_retries):
-        if test_health_endpoint():
-            break
-        if i < max_retries - 1:
-            print(f"   Retrying in 2 seconds... ({i+1}/{max_retries})")
-            time.sleep(2)
-        else:
-            print("❌ Server is not responding. Please start the Flask server first.")
-            return
+    if not wait_ready() or not test_health_endpoint():
+        print("❌ Server is not responding. Please start the Flask server first.")
+        return
     
     # Run all tests
     test_results = []
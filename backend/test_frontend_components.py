@@ -11,6 +11,9 @@ import json
 import time
 from pathlib import Path
 
+# Shared keep-alive connection to the dev server for every request in this run
+SESSION = requests.Session()
+
 def test_frontend_endpoint_integration():
     """Test that frontend endpoints are properly integrated"""
     print("🔍 Testing frontend-backend integration...")
@@ -29,7 +32,7 @@ def test_frontend_endpoint_integration():
     for endpoint in endpoints_to_test:
         try:
             if endpoint == '/health':
-                response = requests.get(f'http://localhost:5000{endpoint}', timeout=5)
+                response = SESSION.get(f'http://localhost:5000{endpoint}', timeout=5)
             else:
                 # These endpoints require POST with data
                 test_data = {
@@ -46,7 +49,7 @@ def test_frontend_endpoint_integration():
                 elif endpoint == '/api/translate':
                     test_data = {'text': 'Hello', 'target_language': 'Spanish', 'source_language_code': 'en'}
                 
-                response = requests.post(
+                response = SESSION.post(
                     f'http://localhost:5000{endpoint}',
                     json=test_data,
                     headers={'Content-Type': 'application/json'},
@@ -118,7 +121,7 @@ def test_error_responses():
     results = []
     for test in error_tests:
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f'http://localhost:5000{test["endpoint"]}',
                 json=test['data'],
                 headers={'Content-Type': 'application/json'},
@@ -151,7 +154,7 @@ def test_json_response_structure():
     
     try:
         # Test a successful response
-        response = requests.get('http://localhost:5000/health', timeout=5)
+        response = SESSION.get('http://localhost:5000/health', timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -201,7 +204,7 @@ def main():
     
     # Check if server is running
     try:
-        response = requests.get('http://localhost:5000/health', timeout=5)
+        response = SESSION.get('http://localhost:5000/health', timeout=5)
         if response.status_code != 200:
             print("❌ Backend server is not running. Please start it first.")
             return False
@@ -3,6 +3,8 @@ import os
 import json
 from io import BytesIO
 
+from utils import ocr_processor
+
 # The base directory for sample files
 SAMPLES_DIR = os.path.join(os.path.dirname(__file__), 'sample_files')
 
@@ -53,6 +55,92 @@ def test_process_csv_file(client):
     assert 'Third, with comma' in json_data['extracted_text']
     assert '100' in json_data['extracted_text']
 
+def test_process_cp1252_csv_file(client):
+    """Test a cp1252 .csv whose first 32 KiB is plain ASCII, so the sniffed prefix looks like UTF-8."""
+    rows = ["Item,Price"] + [f"Filler item {i},{i}" for i in range(3000)] + ["Café crème,€5"]
+    content = "\r\n".join(rows).encode('cp1252')
+    assert len(content) > ocr_processor.ENCODING_SNIFF_BYTES
+    data = {
+        'file': (BytesIO(content), 'cp1252.csv')
+    }
+    response = client.post('/api/process', data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    json_data = json.loads(response.data)
+    assert json_data['success'] is True
+    assert 'Café crème | €5' in json_data['original_text']
+    assert '\ufffd' not in json_data['original_text']
+
+def test_process_cp1252_txt_file(client):
+    """Test processing a .txt file saved as cp1252 rather than UTF-8."""
+    content = ("The tenant’s deposit of €500 is refundable — provided the café premises "
+               "are returned in good condition at the end of the lease.").encode('cp1252')
+    data = {
+        'file': (BytesIO(content), 'cp1252.txt')
+    }
+    response = client.post('/api/process', data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    json_data = json.loads(response.data)
+    assert json_data['success'] is True
+    assert 'tenant’s deposit of €500 is refundable — provided the café' in json_data['original_text']
+
+def test_process_xlsx_file(client):
+    """Test the .xlsx rendering: one section per sheet, non-empty cells joined with ' | '."""
+    openpyxl = pytest.importorskip('openpyxl')
+    workbook = openpyxl.Workbook()
+    parties = workbook.active
+    parties.title = 'Parties'
+    parties.append(['Name', 'Role'])
+    parties.append(['Acme Corp', 'Seller'])
+    parties.append(['John Smith', None])
+    parties.append([None, '  '])
+    terms = workbook.create_sheet('Terms')
+    terms.append(['Payment', 30])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+
+    data = {
+        'file': (buffer, 'test.xlsx')
+    }
+    response = client.post('/api/process', data=data, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    json_data = json.loads(response.data)
+    assert json_data['success'] is True
+    assert json_data['original_text'] == (
+        "=== Sheet: Parties ===\n"
+        "Name | Role\n"
+        "Acme Corp | Seller\n"
+        "John Smith\n"
+        "\n"
+        "=== Sheet: Terms ===\n"
+        "Payment | 30\n"
+    )
+
+def test_detect_language_without_fasttext_model(mocker):
+    """Test that detect_language uses langdetect when the fastText model is unavailable."""
+    mocker.patch.object(ocr_processor, 'get_lid_model', return_value=None)
+    langdetect_detect = mocker.patch.object(ocr_processor, 'detect', return_value='fr')
+
+    assert ocr_processor.detect_language("Le contrat est signé.") == 'fr'
+    langdetect_detect.assert_called_once_with("Le contrat est signé.")
+
+def test_detect_language_low_fasttext_confidence(mocker):
+    """Test that fastText labels below FASTTEXT_MIN_CONFIDENCE are left to langdetect."""
+    lid_model = mocker.Mock()
+    mocker.patch.object(ocr_processor, 'get_lid_model', return_value=lid_model)
+    langdetect_detect = mocker.patch.object(ocr_processor, 'detect', return_value='fr')
+
+    lid_model.predict.return_value = (['__label__de'], [0.3])
+    assert ocr_processor.detect_language("Le contrat\nest signé.") == 'fr'
+    lid_model.predict.assert_called_once_with("Le contrat est signé.", k=1)
+
+    lid_model.predict.return_value = (['__label__de'], [0.9])
+    assert ocr_processor.detect_language("Der Vertrag ist unterschrieben.") == 'de'
+    langdetect_detect.assert_called_once()
+
 def test_unsupported_file_type(client):
     """Test uploading a file type that is not supported."""
     data = {
@@ -1,11 +1,16 @@
 import io
 import os
+import codecs
+import asyncio
 import pytesseract
 from PIL import Image
 import tempfile
 import subprocess
 import sys
 import re
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
@@ -14,6 +19,7 @@ from spacy.language import Language
 from spacy.tokens import Doc
 from translate import Translator
 from langdetect import detect, LangDetectException
+from langdetect.detector_factory import init_factory
 import pycountry
 
 # Import for Word document processing
@@ -26,7 +32,7 @@ except ImportError:
 
 # Import for PDF processing
 try:
-    from pdf2image import convert_from_bytes, convert_from_path
+    from pdf2image import convert_from_bytes, convert_from_path, pdfinfo_from_path
     PDF_SUPPORT = True
 except ImportError:
     PDF_SUPPORT = False
@@ -59,8 +65,7 @@ except ImportError:
 
 # Import for HTML processing
 try:
-    from bs4 import BeautifulSoup
-    import lxml
+    from lxml import html as lxml_html
     HTML_SUPPORT = True
 except ImportError:
     HTML_SUPPORT = False
@@ -80,6 +85,13 @@ try:
 except ImportError:
     EASYOCR_SUPPORT = False
 
+# Import for fast language identification (falls back to langdetect)
+try:
+    import fasttext
+    FASTTEXT_SUPPORT = True
+except ImportError:
+    FASTTEXT_SUPPORT = False
+
 # Set up Google Cloud Vision client
 # Ensure GOOGLE_APPLICATION_CREDENTIALS environment variable is set
 # or provide credentials directly.
@@ -105,87 +117,177 @@ except OSError:
     subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
     nlp = spacy.load('en_core_web_sm')
 
-def get_tesseract_lang_code(iso_code):
-    """Convert ISO 639-1 (2-letter) to ISO 639-2 (3-letter) for Tesseract."""
-    # Enhanced mapping for better language support including Hindi/Devanagari
-    enhanced_mapping = {
-        # Chinese variants
-        'zh-cn': 'chi_sim',
-        'zh-tw': 'chi_tra',
-        'zh': 'chi_sim',  # Default Chinese to simplified
-        
-        # Indian languages
-        'hi': 'hin',      # Hindi - Devanagari script
-        'sa': 'san',      # Sanskrit - Devanagari script
-        'mr': 'mar',      # Marathi - Devanagari script
-        'ne': 'nep',      # Nepali - Devanagari script
-        'bn': 'ben',      # Bengali
-        'gu': 'guj',      # Gujarati
-        'kn': 'kan',      # Kannada
-        'ml': 'mal',      # Malayalam
-        'or': 'ori',      # Odia
-        'pa': 'pan',      # Punjabi
-        'ta': 'tam',      # Tamil
-        'te': 'tel',      # Telugu
-        'ur': 'urd',      # Urdu
-        
-        # Other Asian languages
-        'ja': 'jpn',      # Japanese
-        'ko': 'kor',      # Korean
-        'th': 'tha',      # Thai
-        'vi': 'vie',      # Vietnamese
-        
-        # Middle Eastern
-        'ar': 'ara',      # Arabic
-        'fa': 'fas',      # Persian/Farsi
-        'he': 'heb',      # Hebrew
-        
-        # European
-        'en': 'eng',      # English
-        'es': 'spa',      # Spanish
-        'fr': 'fra',      # French
-        'de': 'deu',      # German
-        'it': 'ita',      # Italian
-        'pt': 'por',      # Portuguese
-        'ru': 'rus',      # Russian
-        'pl': 'pol',      # Polish
-        'nl': 'nld',      # Dutch
-        'sv': 'swe',      # Swedish
-        'no': 'nor',      # Norwegian
-        'da': 'dan',      # Danish
-        'fi': 'fin',      # Finnish
-        'tr': 'tur',      # Turkish
-        'el': 'ell',      # Greek
-        'bg': 'bul',      # Bulgarian
-        'cs': 'ces',      # Czech
-        'sk': 'slk',      # Slovak
-        'hr': 'hrv',      # Croatian
-        'sr': 'srp',      # Serbian
-        'sl': 'slv',      # Slovenian
-        'et': 'est',      # Estonian
-        'lv': 'lav',      # Latvian
-        'lt': 'lit',      # Lithuanian
-        'hu': 'hun',      # Hungarian
-        'ro': 'ron',      # Romanian
-        'uk': 'ukr',      # Ukrainian
-    }
+# Lightweight rule-based pipeline for callers that only need sentence boundaries
+sentence_nlp = spacy.blank('en')
+sentence_nlp.add_pipe('sentencizer')
+
+# Precompiled patterns used by the text cleanup and key point helpers
+_RE_WS = re.compile(r'\s+')
+_RE_NONASCII = re.compile(r'[^\x00-\x7F]+')
+_RE_LI_DIGIT = re.compile(r'[lI](?=\d)')
+_RE_O_DIGIT = re.compile(r'O(?=\d)')
+_RE_DIGIT_O = re.compile(r'(?<=\d)[oO]')
+_RE_DEVANAGARI = re.compile(r'[\u0900-\u097F]')
+
+# Phrases that mark a sentence as a likely key point in legal text
+KEY_PHRASES = frozenset([
+    'must', 'shall', 'will', 'agree', 'require', 'important',
+    'deadline', 'payment', 'terms', 'condition'
+])
+KEY_ENTITY_LABELS = frozenset(['ORG', 'PERSON', 'DATE', 'MONEY', 'PERCENT'])
+
+# fastText language identification model, loaded lazily on first use
+FASTTEXT_LID_MODEL_PATH = os.getenv('FASTTEXT_LID_MODEL', 'lid.176.ftz')
+_lid_model = None
+_lid_model_failed = False
+# fastText labels below this probability are left to langdetect
+FASTTEXT_MIN_CONFIDENCE = 0.5
+
+# Guards the lazy language detector loads, which concurrent PDF page workers can race on
+_language_detector_lock = threading.Lock()
+_langdetect_loaded = False
+
+def get_lid_model():
+    """Load the fastText language identification model once, or return None if unavailable."""
+    global _lid_model, _lid_model_failed
+    if _lid_model is None and FASTTEXT_SUPPORT and not _lid_model_failed:
+        with _language_detector_lock:
+            if _lid_model is None and not _lid_model_failed:
+                try:
+                    _lid_model = fasttext.load_model(FASTTEXT_LID_MODEL_PATH)
+                except Exception as e:
+                    print(f"fastText language model unavailable, falling back to langdetect: {e}")
+                    _lid_model_failed = True
+    return _lid_model
+
+def load_langdetect_profiles():
+    """Load langdetect's profiles once; its own lazy init publishes the factory before loading them."""
+    global _langdetect_loaded
+    if not _langdetect_loaded:
+        with _language_detector_lock:
+            if not _langdetect_loaded:
+                init_factory()
+                _langdetect_loaded = True
+
+def detect_language(text):
+    """Detect the ISO 639-1 language code of text, preferring fastText over langdetect."""
+    lid_model = get_lid_model()
+    if lid_model is not None:
+        try:
+            # fastText predicts line by line, so newlines must be flattened first
+            labels, probabilities = lid_model.predict(text.replace('\n', ' '), k=1)
+            if len(labels) and probabilities[0] >= FASTTEXT_MIN_CONFIDENCE:
+                return labels[0].replace('__label__', '')
+        except Exception as e:
+            # e.g. fasttext-wheel's np.array(copy=False) ValueError under numpy 2
+            print(f"fastText prediction failed, falling back to langdetect: {e}")
+    load_langdetect_profiles()
+    return detect(text)
+
+# Enhanced mapping for better language support including Hindi/Devanagari
+TESSERACT_LANG_MAPPING = {
+    # Chinese variants
+    'zh-cn': 'chi_sim',
+    'zh-tw': 'chi_tra',
+    'zh': 'chi_sim',  # Default Chinese to simplified
+    
+    # Indian languages
+    'hi': 'hin',      # Hindi - Devanagari script
+    'sa': 'san',      # Sanskrit - Devanagari script
+    'mr': 'mar',      # Marathi - Devanagari script
+    'ne': 'nep',      # Nepali - Devanagari script
+    'bn': 'ben',      # Bengali
+    'gu': 'guj',      # Gujarati
+    'kn': 'kan',      # Kannada
+    'ml': 'mal',      # Malayalam
+    'or': 'ori',      # Odia
+    'pa': 'pan',      # Punjabi
+    'ta': 'tam',      # Tamil
+    'te': 'tel',      # Telugu
+    'ur': 'urd',      # Urdu
     
-    # Check enhanced mapping first
-    if iso_code in enhanced_mapping:
-        return enhanced_mapping[iso_code]
+    # Other Asian languages
+    'ja': 'jpn',      # Japanese
+    'ko': 'kor',      # Korean
+    'th': 'tha',      # Thai
+    'vi': 'vie',      # Vietnamese
     
-    # Try pycountry as fallback
+    # Middle Eastern
+    'ar': 'ara',      # Arabic
+    'fa': 'fas',      # Persian/Farsi
+    'he': 'heb',      # Hebrew
+    
+    # European
+    'en': 'eng',      # English
+    'es': 'spa',      # Spanish
+    'fr': 'fra',      # French
+    'de': 'deu',      # German
+    'it': 'ita',      # Italian
+    'pt': 'por',      # Portuguese
+    'ru': 'rus',      # Russian
+    'pl': 'pol',      # Polish
+    'nl': 'nld',      # Dutch
+    'sv': 'swe',      # Swedish
+    'no': 'nor',      # Norwegian
+    'da': 'dan',      # Danish
+    'fi': 'fin',      # Finnish
+    'tr': 'tur',      # Turkish
+    'el': 'ell',      # Greek
+    'bg': 'bul',      # Bulgarian
+    'cs': 'ces',      # Czech
+    'sk': 'slk',      # Slovak
+    'hr': 'hrv',      # Croatian
+    'sr': 'srp',      # Serbian
+    'sl': 'slv',      # Slovenian
+    'et': 'est',      # Estonian
+    'lv': 'lav',      # Latvian
+    'lt': 'lit',      # Lithuanian
+    'hu': 'hun',      # Hungarian
+    'ro': 'ron',      # Romanian
+    'uk': 'ukr',      # Ukrainian
+}
+
+@lru_cache(maxsize=256)
+def resolve_language(iso_code):
+    """Resolve an ISO 639-1 code to its (Tesseract code, display name), cached per code."""
     try:
         lang = pycountry.languages.get(alpha_2=iso_code)
-        if lang and hasattr(lang, 'alpha_3'):
-            return lang.alpha_3
-    except (AttributeError, KeyError):
-        pass
+    except (AttributeError, LookupError):
+        lang = None
     
-    # Default to English if no mapping found
-    return 'eng'
+    # Check enhanced mapping first, then pycountry, defaulting to English
+    if iso_code in TESSERACT_LANG_MAPPING:
+        tesseract_code = TESSERACT_LANG_MAPPING[iso_code]
+    elif lang and hasattr(lang, 'alpha_3'):
+        tesseract_code = lang.alpha_3
+    else:
+        tesseract_code = 'eng'
+    
+    lang_name = lang.name if lang else iso_code.upper()
+    return tesseract_code, lang_name
+
+def get_tesseract_lang_code(iso_code):
+    """Convert ISO 639-1 (2-letter) to ISO 639-2 (3-letter) for Tesseract."""
+    return resolve_language(iso_code)[0]
+
+def _tesseract_image_to_string(image_path_or_obj, lang, single_threaded=False):
+    """
+    Run Tesseract on an image. With single_threaded, an image file is OCR'd by a Tesseract
+    child limited to one OpenMP thread, so concurrent PDF pages don't oversubscribe the CPUs.
+    """
+    if not (single_threaded and isinstance(image_path_or_obj, str)):
+        return pytesseract.image_to_string(image_path_or_obj, lang=lang)
+    # pytesseract always hands os.environ to Tesseract, so run it directly with the limit;
+    # an explicit OMP_THREAD_LIMIT from the user still wins
+    proc = subprocess.run(
+        [pytesseract.pytesseract.tesseract_cmd, image_path_or_obj, 'stdout', '-l', lang],
+        capture_output=True, env={'OMP_THREAD_LIMIT': '1', **os.environ}
+    )
+    if proc.returncode:
+        raise pytesseract.TesseractError(proc.returncode, proc.stderr.decode('utf-8', errors='replace'))
+    return proc.stdout.decode('utf-8')
 
-def perform_ocr_with_lang_detect(image_path_or_obj):
+def perform_ocr_with_lang_detect(image_path_or_obj, single_threaded=False):
     """
     Performs OCR on an image, attempting to gracefully handle multiple languages,
     and translating to English if needed.
@@ -205,11 +307,11 @@ def perform_ocr_with_lang_detect(image_path_or_obj):
         # This is surprisingly effective as Tesseract can handle scripts simultaneously.
         try:
             # Use English and Hindi packs together. Tesseract will pick the best fit.
-            tesseract_dual_text = pytesseract.image_to_string(image_path_or_obj, lang='eng+hin')
+            tesseract_dual_text = _tesseract_image_to_string(image_path_or_obj, 'eng+hin', single_threaded)
         except pytesseract.TesseractError as e:
             # Handle cases where language packs might be missing
             print(f"Dual-language OCR failed, falling back to English. Error: {e}")
-            tesseract_dual_text = pytesseract.image_to_string(image_path_or_obj, lang='eng')
+            tesseract_dual_text = _tesseract_image_to_string(image_path_or_obj, 'eng', single_threaded)
 
         # 2. Use EasyOCR for a potentially better Hindi/mixed-language result.
         easyocr_text = None
@@ -222,20 +324,18 @@ def perform_ocr_with_lang_detect(image_path_or_obj):
         
         # 3. Choose the best OCR result.
         # We check for Devanagari characters to determine if it's likely Hindi.
-        devanagari_chars_regex = re.compile(r'[\u0900-\u097F]')
-        
         final_ocr_text = tesseract_dual_text # Default to Tesseract's result
         iso_code = 'en' # Default to English
 
         # Check if EasyOCR provided a better result for Hindi
-        if easyocr_text and devanagari_chars_regex.search(easyocr_text):
+        if easyocr_text and _RE_DEVANAGARI.search(easyocr_text):
             # If EasyOCR text has more content and contains Hindi, prefer it.
             if len(easyocr_text) > len(tesseract_dual_text):
                  final_ocr_text = easyocr_text
                  iso_code = 'hi'
 
         # Check Tesseract's result if we haven't already decided on Hindi
-        elif devanagari_chars_regex.search(tesseract_dual_text):
+        elif _RE_DEVANAGARI.search(tesseract_dual_text):
             iso_code = 'hi'
         
         # If we think it's Hindi, try to get a better name for it.
@@ -245,9 +345,8 @@ def perform_ocr_with_lang_detect(image_path_or_obj):
         else:
             # If no Devanagari, we can try to detect other languages.
             try:
-                iso_code = detect(final_ocr_text[:2000]) if final_ocr_text else 'en'
-                lang_obj = pycountry.languages.get(alpha_2=iso_code)
-                result['detected_lang_name'] = lang_obj.name if lang_obj else iso_code.upper()
+                iso_code = detect_language(final_ocr_text[:2000]) if final_ocr_text else 'en'
+                _, result['detected_lang_name'] = resolve_language(iso_code)
                 result['detected_lang_code'] = iso_code
             except Exception:
                 # Fallback to English if detection fails
@@ -276,6 +375,27 @@ def perform_ocr_with_lang_detect(image_path_or_obj):
         result['text'] = f"Error: OCR processing failed - {str(e)}"
         return result
 
+# Maximum number of PDF pages OCR'd at the same time; kept small because every page job
+# runs its own Tesseract process and may also run EasyOCR
+OCR_CONCURRENCY = int(os.getenv('OCR_CONCURRENCY', min(4, os.cpu_count() or 1)))
+
+# PDF pages rendered (as ~25 MB 300-dpi TIFFs) and OCR'd per batch, so temp space stays bounded
+PDF_RENDER_BATCH = max(1, OCR_CONCURRENCY) * 2
+
+async def _ocr_pages(pages):
+    """
+    OCR PDF pages (image paths or objects) concurrently, returning per-page results in page order.
+    Tesseract runs as a subprocess, so pages overlap while waiting on it.
+    """
+    semaphore = asyncio.Semaphore(max(1, OCR_CONCURRENCY))
+    loop = asyncio.get_running_loop()
+
+    async def ocr_page(page):
+        async with semaphore:
+            return await loop.run_in_executor(None, perform_ocr_with_lang_detect, page, True)
+
+    return await asyncio.gather(*(ocr_page(page) for page in pages))
+
 def auto_translate_to_english(text, source_language_code):
     """
     Automatically translate text to English using multiple translation services.
@@ -507,41 +627,36 @@ def extract_text_from_excel(filepath):
         file_extension = os.path.splitext(filepath)[1].lower()
         
         if file_extension == '.xlsx':
-            # Use openpyxl for .xlsx files
-            workbook = openpyxl.load_workbook(filepath, data_only=True)
+            # read_only streams rows instead of building the whole cell graph in memory
+            workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
             text_parts = []
             
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                text_parts.append(f"=== Sheet: {sheet_name} ===")
-                
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = []
-                    for cell in row:
-                        if cell is not None and str(cell).strip():
-                            row_text.append(str(cell))
-                    if row_text:
-                        text_parts.append(" | ".join(row_text))
-                text_parts.append("")
+            try:
+                for sheet in workbook.worksheets:
+                    text_parts.append(f"=== Sheet: {sheet.title} ===")
+                    
+                    for row in sheet.iter_rows(values_only=True):
+                        row_text = [str(cell) for cell in row if cell is not None and str(cell).strip()]
+                        if row_text:
+                            text_parts.append(" | ".join(row_text))
+                    text_parts.append("")
+            finally:
+                workbook.close()
             
             return "\n".join(text_parts)
         
         elif file_extension == '.xls':
-            # Use pandas for .xls files (handles both xlrd and openpyxl)
+            # Use pandas for .xls files; sheet_name=None parses the workbook once for all sheets
             try:
-                excel_file = pd.ExcelFile(filepath)
+                sheets = pd.read_excel(filepath, sheet_name=None)
                 text_parts = []
                 
-                for sheet_name in excel_file.sheet_names:
-                    df = pd.read_excel(filepath, sheet_name=sheet_name)
+                for sheet_name, df in sheets.items():
                     text_parts.append(f"=== Sheet: {sheet_name} ===")
                     
                     # Convert DataFrame to text
                     for index, row in df.iterrows():
-                        row_text = []
-                        for value in row:
-                            if pd.notna(value) and str(value).strip():
-                                row_text.append(str(value))
+                        row_text = [str(value) for value in row if pd.notna(value) and str(value).strip()]
                         if row_text:
                             text_parts.append(" | ".join(row_text))
                     text_parts.append("")
@@ -613,20 +728,24 @@ def extract_text_from_opendocument(filepath):
 def extract_text_from_html(filepath):
     """Extract text from HTML files"""
     if not HTML_SUPPORT:
-        return "Error: HTML support not installed. Please install: pip install beautifulsoup4 lxml"
+        return "Error: HTML support not installed. Please install: pip install lxml"
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
+        # Pass raw bytes so lxml honours the document's declared charset
+        with open(filepath, 'rb') as file:
             content = file.read()
         
-        soup = BeautifulSoup(content, 'lxml')
+        if not content.strip():
+            return "No text found in HTML file"
+        
+        tree = lxml_html.fromstring(content)
         
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        for element in tree.xpath('//script|//style'):
+            element.drop_tree()
         
         # Get text
-        text = soup.get_text()
+        text = tree.text_content()
         
         # Clean up whitespace
         lines = (line.strip() for line in text.splitlines())
@@ -641,34 +760,24 @@ def extract_text_from_html(filepath):
 def extract_text_from_csv(filepath):
     """Extract text from CSV files"""
     try:
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+        # Decode once (strictly, see decode_text) and parse once instead of re-parsing per candidate encoding
+        with open(filepath, 'rb') as file:
+            raw_data = file.read()
+        df = pd.read_csv(io.StringIO(decode_text(raw_data, detect_file_encoding(filepath))))
+        text_parts = []
         
-        for encoding in encodings:
-            try:
-                df = pd.read_csv(filepath, encoding=encoding)
-                text_parts = []
-                
-                # Add column headers
-                headers = " | ".join(str(col) for col in df.columns)
-                text_parts.append(f"=== Headers ===\n{headers}\n")
-                
-                # Add data rows
-                text_parts.append("=== Data ===")
-                for index, row in df.iterrows():
-                    row_text = []
-                    for value in row:
-                        if pd.notna(value) and str(value).strip():
-                            row_text.append(str(value))
-                    if row_text:
-                        text_parts.append(" | ".join(row_text))
-                
-                return "\n".join(text_parts)
-            
-            except UnicodeDecodeError:
-                continue
+        # Add column headers
+        headers = " | ".join(str(col) for col in df.columns)
+        text_parts.append(f"=== Headers ===\n{headers}\n")
+        
+        # Add data rows
+        text_parts.append("=== Data ===")
+        for index, row in df.iterrows():
+            row_text = [str(value) for value in row if pd.notna(value) and str(value).strip()]
+            if row_text:
+                text_parts.append(" | ".join(row_text))
         
-        return "Error: Unable to decode CSV file with common encodings"
+        return "\n".join(text_parts)
     
     except Exception as e:
         return f"Error extracting text from CSV: {e}"
@@ -687,16 +796,46 @@ def extract_text_with_textract(filepath):
     except Exception as e:
         return f"Error extracting text with textract: {e}"
 
+# Number of leading bytes inspected when sniffing a file's encoding
+ENCODING_SNIFF_BYTES = 32 * 1024
+
 def detect_file_encoding(filepath):
     """Detect file encoding for better text extraction"""
     try:
+        # A bounded prefix is enough for chardet and keeps memory constant
         with open(filepath, 'rb') as file:
-            raw_data = file.read()
-            result = chardet.detect(raw_data)
-            return result.get('encoding', 'utf-8')
+            raw_data = file.read(ENCODING_SNIFF_BYTES)
+        # A prefix that decodes as UTF-8 (plain ASCII included) is taken as UTF-8, since chardet
+        # would call an ASCII prefix 'ascii' and lose any accented text or ₹/§ signs further on.
+        # The incremental decoder tolerates a multi-byte sequence cut off at the prefix boundary.
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(raw_data)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        result = chardet.detect(raw_data)
+        return result.get('encoding') or 'utf-8'
     except:
         return 'utf-8'
 
+def decode_text(raw_data, encoding):
+    """Decode bytes strictly with the sniffed encoding, then UTF-8 and cp1252, replacing bad bytes only as a last resort"""
+    for candidate in dict.fromkeys([encoding, 'utf-8', 'cp1252']):
+        try:
+            return raw_data.decode(candidate)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    return raw_data.decode('utf-8', errors='replace')
+
+# EasyOCR readers hold a torch model each: build one per language set and run them one at a time
+_easyocr_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def get_easyocr_reader(languages):
+    """Build the EasyOCR reader for a tuple of language codes once; call with _easyocr_lock held."""
+    print(f"Loading EasyOCR reader for languages: {list(languages)}")
+    return easyocr.Reader(list(languages))
+
 def extract_text_with_easyocr(filepath, detected_language='en'):
     """Alternative OCR using EasyOCR for better multilingual support, especially for Hindi/Devanagari"""
     if not EASYOCR_SUPPORT:
@@ -736,8 +875,8 @@ def extract_text_with_easyocr(filepath, detected_language='en'):
         languages = easyocr_lang_mapping.get(detected_language, ['en'])
         
         print(f"Using EasyOCR with languages: {languages}")
-        reader = easyocr.Reader(languages)
-        result = reader.readtext(filepath)
+        with _easyocr_lock:
+            result = get_easyocr_reader(tuple(languages)).readtext(filepath)
         
         # Extract text from results with lower confidence threshold for non-Latin scripts
         confidence_threshold = 0.3 if detected_language in ['hi', 'hin', 'bn', 'ta', 'te', 'kn', 'ml', 'gu', 'or', 'pa', 'ur', 'ar', 'fa'] else 0.5
@@ -794,20 +933,11 @@ def extract_text_from_doc(filepath):
 def extract_text_from_txt(filepath):
     """Extract text from TXT files"""
     try:
-        # First try to detect encoding
-        if ADVANCED_TEXT_SUPPORT:
-            encoding = detect_file_encoding(filepath)
-            encodings = [encoding, 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        else:
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        
-        for encoding in encodings:
-            try:
-                with open(filepath, 'r', encoding=encoding) as file:
-                    return file.read()
-            except UnicodeDecodeError:
-                continue
-        return "Error: Unable to decode text file with common encodings"
+        # Read once; the sniffed encoding is only a first guess for the strict decode
+        encoding = detect_file_encoding(filepath) if ADVANCED_TEXT_SUPPORT else 'utf-8'
+        with open(filepath, 'rb') as file:
+            raw_data = file.read()
+        return decode_text(raw_data, encoding)
     except Exception as e:
         return f"Error reading text file: {e}"
 
@@ -899,8 +1029,7 @@ def process_ocr(filepath, filename):
             # Try to detect language and auto-translate if not English
             if data and not data.startswith("Error:"):
                 try:
-                    from langdetect import detect
-                    detected_lang = detect(data[:2000])  # Use first 2000 chars for detection
+                    detected_lang = detect_language(data[:2000])  # Use first 2000 chars for detection
                     
                     if detected_lang.lower() not in ['en', 'eng']:
                         print(f"🔄 Auto-translating {detected_lang} document to English...")
@@ -910,11 +1039,7 @@ def process_ocr(filepath, filename):
                             ocr_result['text'] = translated
                             ocr_result['was_translated'] = True
                             ocr_result['detected_lang_code'] = detected_lang
-                            try:
-                                lang_obj = pycountry.languages.get(alpha_2=detected_lang)
-                                ocr_result['detected_lang_name'] = lang_obj.name if lang_obj else detected_lang.upper()
-                            except:
-                                ocr_result['detected_lang_name'] = detected_lang.upper()
+                            _, ocr_result['detected_lang_name'] = resolve_language(detected_lang)
                             ocr_result['warning'] = f"Document was automatically translated from {ocr_result['detected_lang_name']} to English."
                             print(f"✅ Successfully translated document to English")
                         else:
@@ -937,27 +1062,33 @@ def process_ocr(filepath, filename):
         else:
             try:
                 print("📄 Processing PDF with auto-translation to English...")
-                images = convert_from_path(filepath, dpi=300)
-                all_texts = []
-                original_texts = []
-                detected_langs = []
-                was_any_translated = False
+                # Render pages straight to TIFF files so Tesseract reads them from
+                # disk instead of re-encoding each PIL image to a temporary PNG.
+                # Batches keep only PDF_RENDER_BATCH uncompressed pages on disk at once.
+                page_count = pdfinfo_from_path(filepath)['Pages']
+                page_results = []
+                for first_page in range(1, page_count + 1, PDF_RENDER_BATCH):
+                    with tempfile.TemporaryDirectory() as page_dir:
+                        page_paths = convert_from_path(
+                            filepath, dpi=300, fmt='tiff', thread_count=os.cpu_count() or 1,
+                            output_folder=page_dir, paths_only=True, first_page=first_page,
+                            last_page=min(first_page + PDF_RENDER_BATCH - 1, page_count)
+                        )
+                        page_results.extend(asyncio.run(_ocr_pages(page_paths)))
                 
-                for i, image in enumerate(images):
-                    page_result = perform_ocr_with_lang_detect(image)
-                    all_texts.append(f"--- Page {i+1} ---\\n{page_result['text'].strip()}")
-                    original_texts.append(f"--- Page {i+1} ---\\n{page_result.get('original_text', page_result['text']).strip()}")
-                    
-                    if page_result['detected_lang_code'] not in detected_langs:
-                        detected_langs.append(page_result['detected_lang_code'])
-                    
-                    if page_result.get('was_translated', False):
-                        was_any_translated = True
+                # Collect each field into its own list, then join once
+                texts = [page['text'].strip() for page in page_results]
+                original_texts = [page.get('original_text', page['text']).strip() for page in page_results]
+                lang_codes = [page['detected_lang_code'] for page in page_results]
+                was_any_translated = any(page.get('was_translated', False) for page in page_results)
+                
+                # Unique languages in first-seen order
+                detected_langs = list(dict.fromkeys(lang_codes))
                 
                 # Consolidate results
                 update_result({
-                    'text': "\\n\\n".join(all_texts),
-                    'original_text': "\\n\\n".join(original_texts),
+                    'text': "\n\n".join(f"--- Page {i+1} ---\n{text}" for i, text in enumerate(texts)),
+                    'original_text': "\n\n".join(f"--- Page {i+1} ---\n{text}" for i, text in enumerate(original_texts)),
                     'detected_lang_name': ', '.join(lang.capitalize() for lang in detected_langs),
                     'detected_lang_code': ','.join(detected_langs),
                     'was_translated': was_any_translated,
@@ -1030,12 +1161,12 @@ def clean_text(text: str) -> str:
         return ""
     
     # Basic cleanup
-    text = re.sub(r'\s+', ' ', text)  # Remove multiple spaces
-    text = re.sub(r'[^\x00-\x7F]+', '', text)  # Remove non-ASCII characters
+    text = _RE_WS.sub(' ', text)  # Remove multiple spaces
+    text = _RE_NONASCII.sub('', text)  # Remove non-ASCII characters
     text = text.strip()
     
-    # Process with spaCy
-    doc = nlp(text)
+    # Split sentences with the rule-based sentencizer (no tagger/parser/NER needed)
+    doc = sentence_nlp(text)
     
     # Reconstruct text with proper formatting
     sentences = []
@@ -1043,7 +1174,7 @@ def clean_text(text: str) -> str:
     
     for sent in doc.sents:
         # Clean the sentence
-        clean_sent = re.sub(r'\s+', ' ', sent.text.strip())
+        clean_sent = _RE_WS.sub(' ', sent.text.strip())
         if clean_sent:
             current_paragraph.append(clean_sent)
             
@@ -1060,9 +1191,9 @@ def clean_text(text: str) -> str:
     cleaned_text = '\n\n'.join(sentences)
     
     # Fix common OCR issues
-    cleaned_text = re.sub(r'[lI](?=\d)', '1', cleaned_text)  # Fix common l/I to 1 confusion
-    cleaned_text = re.sub(r'O(?=\d)', '0', cleaned_text)  # Fix common O to 0 confusion
-    cleaned_text = re.sub(r'(?<=\d)[oO]', '0', cleaned_text)  # Fix common o/O to 0 confusion
+    cleaned_text = _RE_LI_DIGIT.sub('1', cleaned_text)  # Fix common l/I to 1 confusion
+    cleaned_text = _RE_O_DIGIT.sub('0', cleaned_text)  # Fix common O to 0 confusion
+    cleaned_text = _RE_DIGIT_O.sub('0', cleaned_text)  # Fix common o/O to 0 confusion
     
     return cleaned_text
 
@@ -1073,10 +1204,11 @@ def summarize_text(text: str) -> str:
     
     # Process with spaCy
     doc = nlp(text)
+    sents = list(doc.sents)
     
     # Calculate sentence importance scores
     sentence_scores = {}
-    for sent in doc.sents:
+    for sent in sents:
         # Score based on length and position
         score = len([token for token in sent if not token.is_stop and token.is_alpha])
         if sent.start == 0:  # First sentence gets a boost
@@ -1084,13 +1216,14 @@ def summarize_text(text: str) -> str:
         sentence_scores[sent.text] = score
     
     # Get top sentences (about 30% of original)
-    num_sentences = max(3, len(list(doc.sents)) // 3)
+    num_sentences = max(3, len(sents) // 3)
     summary_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
+    top_sentences = {sent_text for sent_text, _ in summary_sentences}
     
     # Reconstruct summary in original order
     summary = []
-    for sent in doc.sents:
-        if sent.text in dict(summary_sentences):
+    for sent in sents:
+        if sent.text in top_sentences:
             summary.append(sent.text.strip())
     
     return '\n\n'.join(summary)
@@ -1104,22 +1237,25 @@ def extract_key_points(text: str) -> list:
     doc = nlp(text)
     
     # Extract important sentences based on various criteria
-    key_points = []
+    # (a dict keeps insertion order and gives O(1) duplicate checks)
+    key_points = {}
     for sent in doc.sents:
         # Check for important features
-        has_entity = any(ent.label_ in ['ORG', 'PERSON', 'DATE', 'MONEY', 'PERCENT'] for ent in sent.ents)
+        sent_lower = sent.text.lower()
+        has_entity = any(ent.label_ in KEY_ENTITY_LABELS for ent in sent.ents)
         has_numbers = any(token.like_num for token in sent)
-        has_key_phrase = any(phrase in sent.text.lower() for phrase in [
-            'must', 'shall', 'will', 'agree', 'require', 'important',
-            'deadline', 'payment', 'terms', 'condition'
-        ])
+        has_key_phrase = any(phrase in sent_lower for phrase in KEY_PHRASES)
         
         if has_entity or has_numbers or has_key_phrase:
-            clean_sent = re.sub(r'\s+', ' ', sent.text.strip())
-            if clean_sent and clean_sent not in key_points:
-                key_points.append(clean_sent)
+            clean_sent = _RE_WS.sub(' ', sent.text.strip())
+            if clean_sent:
+                key_points.setdefault(clean_sent, None)
     
-    return key_points
+    return list(key_points)
+
+# Number of translation requests issued in parallel by translate_text; the free MyMemory
+# backend rate-limits bursts, so the default is small
+TRANSLATION_WORKERS = int(os.getenv('TRANSLATION_WORKERS', 3))
 
 def translate_text(text: str, target_language: str) -> str:
     """Translate text to target language"""
@@ -1151,16 +1287,27 @@ def translate_text(text: str, target_language: str) -> str:
         if current_chunk:
             chunks.append(' '.join(current_chunk))
         
-        # Translate each chunk
-        translated_chunks = []
-        for chunk in chunks:
+        failed_chunks = []
+        
+        def translate_chunk(chunk):
             try:
                 translated = translator.translate(chunk)
-                if translated:
-                    translated_chunks.append(translated)
+                # MyMemory reports quota/rate limits as the "translation" itself
+                if translated.startswith('MYMEMORY WARNING'):
+                    raise RuntimeError(translated)
+                return translated
             except Exception as e:
                 print(f"Translation error for chunk: {e}")
-                translated_chunks.append(chunk)  # Keep original on error
+                failed_chunks.append(chunk)
+                return chunk  # Keep original on error
+        
+        # Translate chunks concurrently; executor.map preserves chunk order
+        with ThreadPoolExecutor(max_workers=max(1, TRANSLATION_WORKERS)) as executor:
+            translated_chunks = [translated for translated in executor.map(translate_chunk, chunks) if translated]
+        
+        if failed_chunks:
+            print(f"⚠️ {len(failed_chunks)} of {len(chunks)} chunks could not be translated to {target_language} "
+                  f"and were left in the original language")
         
         # Join translated chunks
         return '\n\n'.join(translated_chunks)
@@ -1187,12 +1334,13 @@ def compare_documents(text1: str, text2: str) -> dict:
     sentences2 = [sent.text.strip() for sent in doc2.sents]
     
     # Find common and different sentences
-    common = set(sentences1) & set(sentences2)
-    only_in_1 = set(sentences1) - set(sentences2)
-    only_in_2 = set(sentences2) - set(sentences1)
+    set1, set2 = set(sentences1), set(sentences2)
+    common = set1 & set2
+    only_in_1 = set1 - set2
+    only_in_2 = set2 - set1
     
     # Calculate similarity percentage
-    total_sentences = len(set(sentences1) | set(sentences2))
+    total_sentences = len(set1 | set2)
     similarity = len(common) / total_sentences if total_sentences > 0 else 0
     
     # Format differences
@@ -4,15 +4,17 @@ OCR Legal Document Processor - System Checker
 Comprehensive validation of all files, dependencies, and configurations.
 """
 
+# Module imports used by a single check are deferred into that check to keep startup short
 import os
 import sys
-import json
-import subprocess
-import platform
-import ast
 import re
+import time
+import shutil
+import platform
+import functools
 from pathlib import Path
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Tuple
 
 class Colors:
     GREEN = '\033[92m'
@@ -25,103 +27,389 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Plain output when redirected, or when NO_COLOR / TERM=dumb ask for it
+if not sys.stdout.isatty() or 'NO_COLOR' in os.environ or os.environ.get('TERM') == 'dumb':
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+# Host OS, resolved once per process
+SYSTEM = platform.system().lower()
+
+# Optional vectorized pre-filter for the bracket scan
+try:
+    import numpy as np
+    NUMPY_SUPPORT = True
+except ImportError:
+    NUMPY_SUPPORT = False
+
+BRACKET_PAIRS = {'(': ')', '[': ']', '{': '}'}
+# Brackets plus every byte that can open or close a string or comment
+_SCAN_BYTES = b'()[]{}\'"`/*\\\n$'
+
+def _scan_positions(data: bytes):
+    """Return (byte offset, char) pairs for every _SCAN_BYTES byte in data"""
+    if NUMPY_SUPPORT:
+        buf = np.frombuffer(data, dtype=np.uint8)
+        positions = np.flatnonzero(np.isin(buf, np.frombuffer(_SCAN_BYTES, dtype=np.uint8)))
+        return zip(positions.tolist(), buf[positions].tobytes().decode('ascii'))
+    return ((i, chr(byte)) for i, byte in enumerate(data) if byte in _SCAN_BYTES)
+
+# Every JSX probe in one pass; group names are checked by membership
+_JSX_PROBE = re.compile(
+    r'(?P<cn>className=)|(?P<cls>\bclass=)|(?P<react>import\s+React)|(?P<jsx>jsx)|(?P<lt><)'
+)
+_JSX_PROBE_GROUPS = frozenset(_JSX_PROBE.groupindex)
+
+def _jsx_probe(content: str, hits: set) -> set:
+    """Add the names of the _JSX_PROBE groups that occur in content to hits"""
+    for match in _JSX_PROBE.finditer(content):
+        hits.add(match.lastgroup)
+        if len(hits) == len(_JSX_PROBE_GROUPS):
+            break
+    return hits
+
+# JavaScript files are scanned in chunks; the probe re-reads a short tail of the
+# previous chunk so tokens split across a boundary are still found
+JS_SCAN_CHUNK_CHARS = 64 * 1024
+_JSX_PROBE_OVERLAP = 64
+
+# Lexer states for _BracketScanner
+_CODE, _LINE_COMMENT, _BLOCK_COMMENT, _SINGLE_QUOTE, _DOUBLE_QUOTE, _TEMPLATE = range(6)
+_QUOTE_STATES = {"'": _SINGLE_QUOTE, '"': _DOUBLE_QUOTE, '`': _TEMPLATE}
+_STATE_QUOTES = {state: quote for quote, state in _QUOTE_STATES.items()}
+# A quote right after a word byte is an apostrophe in JSX text ("Don't"), not a string
+_WORD_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+
+class _BracketScanner:
+    """Incremental bracket matcher that skips strings and comments"""
+    
+    def __init__(self):
+        self.stack = []
+        self.issues = []
+        self.offset = 0
+        self.state = _CODE
+        # Bracket depth at each open ${ so its closing } resumes the template
+        self.templates = []
+        # Previous scanned char, its offset, and whether it was an escaping backslash
+        self.last_char = None
+        self.last_pos = -2
+        self.escaping = False
+        # Last byte of the previous chunk, for the apostrophe check at offset 0
+        self.last_byte = 0
+    
+    def feed(self, data: bytes):
+        stack, issues, templates = self.stack, self.issues, self.templates
+        state = self.state
+        last_char, last_pos, escaping = self.last_char, self.last_pos, self.escaping
+        
+        offset = self.offset
+        for j, char in _scan_positions(data):
+            i = j + offset
+            # Only a directly preceding char pairs with this one ("//", "/*", "${", "\"")
+            prev = last_char if last_pos == i - 1 else None
+            escaped = prev == '\\' and escaping
+            escaping = char == '\\' and not escaped
+            last_char, last_pos = char, i
+            
+            if state == _CODE:
+                if char in BRACKET_PAIRS:
+                    stack.append((char, i))
+                elif char in ')]}':
+                    if char == '}' and templates and templates[-1] == len(stack):
+                        templates.pop()
+                        state = _TEMPLATE
+                    elif not stack:
+                        issues.append(f"Unmatched closing '{char}' at position {i}")
+                    else:
+                        opener, _ = stack.pop()
+                        if BRACKET_PAIRS[opener] != char:
+                            issues.append(f"Mismatched bracket at position {i}")
+                elif char in _QUOTE_STATES:
+                    if char != "'" or (data[j - 1] if j else self.last_byte) not in _WORD_BYTES:
+                        state = _QUOTE_STATES[char]
+                elif prev == '/' and char in '/*':
+                    state = _LINE_COMMENT if char == '/' else _BLOCK_COMMENT
+                    last_char = None
+            elif state == _LINE_COMMENT:
+                if char == '\n':
+                    state = _CODE
+            elif state == _BLOCK_COMMENT:
+                if char == '/' and prev == '*':
+                    state = _CODE
+                    last_char = None
+            elif escaped:
+                continue
+            elif char == _STATE_QUOTES[state]:
+                state = _CODE
+            elif state == _TEMPLATE:
+                if char == '{' and prev == '$':
+                    templates.append(len(stack))
+                    state = _CODE
+            elif char == '\n':
+                # Plain strings cannot span lines; resync rather than swallow the file
+                state = _CODE
+        
+        self.state = state
+        self.last_char, self.last_pos, self.escaping = last_char, last_pos, escaping
+        self.offset += len(data)
+        if data:
+            self.last_byte = data[-1]
+    
+    def finish(self) -> List[str]:
+        for opener, pos in self.stack:
+            self.issues.append(f"Unclosed '{opener}' at position {pos}")
+        return self.issues
+
+# Package name at the start of a requirements.txt line
+_REQUIREMENT_NAME = re.compile(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+_NAME_SEPARATORS = re.compile(r'[-_.]+')
+
+def _normalize_package_name(name: str) -> str:
+    """Normalize a package name per PEP 503 (case and -/_/. runs are insignificant)"""
+    return _NAME_SEPARATORS.sub('-', name).lower()
+
+# External tools probed by check_system_dependencies
+SYSTEM_PROBES = {
+    'node': ['node', '--version'],
+    'tesseract': ['tesseract', '--version'],
+    'poppler': ['pdftoppm', '-h'],
+}
+# Seconds a single probe may take before the tool is treated as unusable
+PROBE_TIMEOUT = 5
+
+def _probe(cmd: List[str]):
+    """Run a version probe, returning None if the binary is not installed or hangs"""
+    path = shutil.which(cmd[0])
+    if path is None:
+        return None
+    import subprocess
+    try:
+        # Run the path which() resolved (node.cmd etc. on Windows), not a second PATH lookup
+        return subprocess.run([path] + cmd[1:], capture_output=True, text=True, timeout=PROBE_TIMEOUT)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+
+# Dev server ports and a bound on how long a single port probe may take
+SERVICE_PORTS = {3000: "Frontend", 5000: "Backend"}
+PORT_PROBE_TIMEOUT = 0.1
+
+def _port_in_use(port: int) -> bool:
+    """Return True if something accepts connections on the local port"""
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(PORT_PROBE_TIMEOUT)
+        # Loopback address directly, so no name resolution is involved
+        return sock.connect_ex(('127.0.0.1', port)) == 0
+
+# Variables every .env needs, plus the settings validate_env_file inspects.
+# One pass finds them all; "USE_LOCAL_NLP=true" also records "USE_LOCAL_NLP".
+ENV_REQUIRED_VARS = ('USE_LOCAL_NLP', 'FLASK_ENV', 'FLASK_DEBUG')
+_ENV_PROBE = re.compile(
+    r'(?P<var>' + '|'.join(map(re.escape, ENV_REQUIRED_VARS + ('GEMINI_API_KEY',))) + r')'
+    r'(?P<assign>=(?:true|false)?)?|(?P<placeholder>your_)'
+)
+
+# Project manifest from the previous run: per-file check results keyed by
+# (mtime, size) and directory listings keyed by the directory's mtime
+MANIFEST_PATH = Path('.sys_check_manifest.json')
+MANIFEST_VERSION = 2
+
+# (ok, errors, warnings) as returned by the per-file checkers
+CheckResult = Tuple[bool, List[str], List[str]]
+
+def phase(title: str):
+    """Run a check section under a title, capturing failures and reporting its wall time"""
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            self._emit(f"{Colors.BLUE}{title}{Colors.END}")
+            try:
+                return check(self, *args, **kwargs)
+            except Exception as e:
+                self.errors.append(f"Unexpected error in {check.__name__}: {e}")
+                self._emit(f"{Colors.RED}❌ Error in {check.__name__}: {e}{Colors.END}")
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._emit(f"{Colors.WHITE}  ⏱ {elapsed_ms:.0f} ms{Colors.END}")
+        return wrapper
+    return decorator
+
 class SystemChecker:
     def __init__(self):
         self.errors = []
         self.warnings = []
         self.info = []
-        self.system = platform.system().lower()
+        self.system = SYSTEM
+        self._manifest = self._load_manifest()
+        self._manifest_dirty = False
+        self._dir_cache: Dict[str, Dict[str, bool]] = {}
+        self._out: List[str] = []
+        
+    def _emit(self, line: str = ""):
+        """Queue a line of output; queued lines are written once per section"""
+        self._out.append(line)
+
+    def _flush(self):
+        """Write all queued output with a single stdout write"""
+        if self._out:
+            self._out.append("")
+            sys.stdout.write("\n".join(self._out))
+            sys.stdout.flush()
+            self._out.clear()
+        
+    def _exists(self, path: str, is_dir: bool = False) -> bool:
+        """Check path existence against a one-time listing of its parent directory"""
+        parent, name = os.path.split(os.path.normpath(path))
+        parent = parent or '.'
+        entries = self._dir_cache.get(parent)
+        if entries is None:
+            try:
+                # Reuse the manifest listing while the directory's mtime is unchanged
+                mtime = os.stat(parent).st_mtime_ns
+                cached = self._manifest['dirs'].get(parent)
+                if cached is not None and cached[0] == mtime:
+                    entries = cached[1]
+                else:
+                    with os.scandir(parent) as it:
+                        entries = {entry.name: entry.is_dir() for entry in it}
+                    self._manifest['dirs'][parent] = [mtime, entries]
+                    self._manifest_dirty = True
+            except OSError:
+                entries = {}
+            self._dir_cache[parent] = entries
+        return name in entries and (entries[name] or not is_dir)
+
+    def _load_manifest(self) -> Dict:
+        """Load the project manifest from a previous run, if compatible"""
+        import json
+        try:
+            with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except Exception:
+            pass
+        return {'version': MANIFEST_VERSION, 'files': {}, 'dirs': {}}
+
+    def _save_manifest(self):
+        """Persist the manifest so unchanged files and directories are skipped next run"""
+        if not self._manifest_dirty:
+            return
+        import json
+        try:
+            with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self._manifest, f)
+        except OSError:
+            pass
+
+    def _cached_check(self, kind: str, file_path: str, check) -> CheckResult:
+        """Run check(file_path) unless this exact file revision was already checked"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return check(file_path)
+        
+        key = f"{kind}:{file_path}"
+        cached = self._manifest['files'].get(key)
+        if cached is not None and cached[:2] == [st.st_mtime_ns, st.st_size]:
+            return tuple(cached[2:])
+        
+        result = check(file_path)
+        self._manifest['files'][key] = [st.st_mtime_ns, st.st_size, *result]
+        self._manifest_dirty = True
+        return result
+
+    def _check_files(self, jobs: List[Tuple[str, str, Callable]]) -> Dict[str, CheckResult]:
+        """Run (kind, path, checker) jobs on a thread pool, keyed by path"""
+        if not jobs:
+            return {}
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda job: self._cached_check(*job), jobs)
+            return {path: result for (_, path, _), result in zip(jobs, results)}
+
+    def _merge_result(self, result: CheckResult) -> bool:
+        """Fold a worker's messages into the shared lists on the main thread"""
+        ok, errors, warnings = result
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        return ok
         
     def print_header(self):
-        print(f"{Colors.CYAN}{Colors.BOLD}")
-        print("=" * 70)
-        print("  OCR LEGAL DOCUMENT PROCESSOR - SYSTEM CHECKER")
-        print("=" * 70)
-        print(f"{Colors.END}")
-        print(f"{Colors.WHITE}Checking all files, dependencies, and configurations...{Colors.END}\n")
-
-    def check_python_syntax(self, file_path: str) -> bool:
+        self._emit(f"{Colors.CYAN}{Colors.BOLD}")
+        self._emit("=" * 70)
+        self._emit("  OCR LEGAL DOCUMENT PROCESSOR - SYSTEM CHECKER")
+        self._emit("=" * 70)
+        self._emit(f"{Colors.END}")
+        self._emit(f"{Colors.WHITE}Checking all files, dependencies, and configurations...{Colors.END}\n")
+
+    def check_python_syntax(self, file_path: str) -> CheckResult:
         """Check Python file for syntax errors"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Check for syntax errors
+            # Check for syntax errors; compiling skips building a Python-level AST
             try:
-                ast.parse(content)
-                return True
+                compile(content, file_path, 'exec', dont_inherit=True)
+                return True, [], []
             except SyntaxError as e:
-                self.errors.append(f"Syntax error in {file_path}:{e.lineno}: {e.msg}")
-                return False
+                return False, [f"Syntax error in {file_path}:{e.lineno}: {e.msg}"], []
                 
         except Exception as e:
-            self.errors.append(f"Could not read {file_path}: {e}")
-            return False
+            return False, [f"Could not read {file_path}: {e}"], []
 
-    def check_javascript_syntax(self, file_path: str) -> bool:
+    def check_javascript_syntax(self, file_path: str) -> CheckResult:
         """Basic JavaScript/JSX syntax checking"""
+        warnings = []
+        is_jsx = file_path.endswith('.jsx')
         try:
+            # Check for unclosed brackets/parentheses, one chunk at a time
+            scanner = _BracketScanner()
+            hits = set()
+            tail = ''
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Basic checks for common issues
-            issues = []
-            
-            # Check for unclosed brackets/parentheses
-            brackets = {'(': ')', '[': ']', '{': '}'}
-            stack = []
-            for i, char in enumerate(content):
-                if char in brackets:
-                    stack.append((char, i))
-                elif char in brackets.values():
-                    if not stack:
-                        issues.append(f"Unmatched closing '{char}' at position {i}")
-                    else:
-                        opener, _ = stack.pop()
-                        if brackets[opener] != char:
-                            issues.append(f"Mismatched bracket at position {i}")
-            
-            if stack:
-                for opener, pos in stack:
-                    issues.append(f"Unclosed '{opener}' at position {pos}")
+                while chunk := f.read(JS_SCAN_CHUNK_CHARS):
+                    scanner.feed(chunk.encode('utf-8'))
+                    if is_jsx:
+                        window = tail + chunk
+                        _jsx_probe(window, hits)
+                        tail = window[-_JSX_PROBE_OVERLAP:]
+            issues = scanner.finish()
             
             # Check for common JSX issues
-            if file_path.endswith('.jsx'):
-                if 'className=' not in content and 'class=' in content:
-                    self.warnings.append(f"{file_path}: Use 'className' instead of 'class' in JSX")
+            if is_jsx:
+                if 'cn' not in hits and 'cls' in hits:
+                    warnings.append(f"{file_path}: Use 'className' instead of 'class' in JSX")
                 
                 # Check for missing React import
-                if 'import React' not in content and ('jsx' in content or '<' in content):
-                    self.warnings.append(f"{file_path}: Missing React import for JSX")
+                if 'react' not in hits and ('jsx' in hits or 'lt' in hits):
+                    warnings.append(f"{file_path}: Missing React import for JSX")
             
             if issues:
-                for issue in issues:
-                    self.errors.append(f"{file_path}: {issue}")
-                return False
+                return False, [f"{file_path}: {issue}" for issue in issues], warnings
             
-            return True
+            return True, [], warnings
             
         except Exception as e:
-            self.errors.append(f"Could not read {file_path}: {e}")
-            return False
+            return False, [f"Could not read {file_path}: {e}"], warnings
 
-    def check_json_syntax(self, file_path: str) -> bool:
+    def check_json_syntax(self, file_path: str) -> CheckResult:
         """Check JSON file for syntax errors"""
+        import json
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 json.load(f)
-            return True
+            return True, [], []
         except json.JSONDecodeError as e:
-            self.errors.append(f"JSON syntax error in {file_path}:{e.lineno}: {e.msg}")
-            return False
+            return False, [f"JSON syntax error in {file_path}:{e.lineno}: {e.msg}"], []
         except Exception as e:
-            self.errors.append(f"Could not read {file_path}: {e}")
-            return False
+            return False, [f"Could not read {file_path}: {e}"], []
 
+    @phase("🐍 Checking backend Python files...")
     def check_backend_files(self):
         """Check all backend Python files"""
-        print(f"{Colors.BLUE}🐍 Checking backend Python files...{Colors.END}")
-        
         backend_files = [
             'backend/app.py',
             'backend/utils/__init__.py',
@@ -129,52 +417,52 @@ class SystemChecker:
             'backend/utils/gemini_client.py'
         ]
         
+        results = self._check_files([
+            ('python', file_path, self.check_python_syntax)
+            for file_path in backend_files if self._exists(file_path)
+        ])
+        
         all_good = True
         for file_path in backend_files:
-            if os.path.exists(file_path):
-                if self.check_python_syntax(file_path):
-                    print(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
+            if file_path in results:
+                if self._merge_result(results[file_path]):
+                    self._emit(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
                 else:
                     all_good = False
-                    print(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
+                    self._emit(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
             else:
                 self.errors.append(f"Missing file: {file_path}")
                 all_good = False
-                print(f"{Colors.RED}  ❌ {file_path} (missing){Colors.END}")
+                self._emit(f"{Colors.RED}  ❌ {file_path} (missing){Colors.END}")
         
         # Check requirements.txt
         req_file = 'backend/requirements.txt'
-        if os.path.exists(req_file):
-            print(f"{Colors.GREEN}  ✅ {req_file}{Colors.END}")
+        if self._exists(req_file):
+            self._emit(f"{Colors.GREEN}  ✅ {req_file}{Colors.END}")
             self.check_requirements_file(req_file)
         else:
             self.errors.append(f"Missing file: {req_file}")
-            print(f"{Colors.RED}  ❌ {req_file} (missing){Colors.END}")
+            self._emit(f"{Colors.RED}  ❌ {req_file} (missing){Colors.END}")
         
         return all_good
 
     def check_requirements_file(self, file_path: str):
         """Check requirements.txt for common issues"""
         try:
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-            
             required_packages = [
                 'Flask', 'Flask-Cors', 'python-dotenv', 'pytesseract', 
                 'pdf2image', 'requests', 'transformers', 'sentencepiece'
             ]
             
-            found_packages = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    package_name = line.split('==')[0].split('>=')[0].split('<=')[0]
-                    found_packages.append(package_name)
+            found_packages = set()
+            with open(file_path, 'r') as f:
+                for line in f:
+                    match = _REQUIREMENT_NAME.match(line)
+                    if match:
+                        found_packages.add(_normalize_package_name(match.group(1)))
             
-            missing = []
-            for pkg in required_packages:
-                if not any(pkg.lower() in found.lower() for found in found_packages):
-                    missing.append(pkg)
+            missing = [pkg for pkg in required_packages
+                       if _normalize_package_name(pkg) not in found_packages]
             
             if missing:
                 self.warnings.append(f"Missing packages in requirements.txt: {', '.join(missing)}")
@@ -182,23 +470,10 @@ class SystemChecker:
         except Exception as e:
             self.warnings.append(f"Could not validate requirements.txt: {e}")
 
+    @phase("⚛️ Checking frontend files...")
     def check_frontend_files(self):
         """Check all frontend files"""
-        print(f"{Colors.BLUE}⚛️ Checking frontend files...{Colors.END}")
-        
-        # Check package.json
         package_json = 'frontend/package.json'
-        if os.path.exists(package_json):
-            if self.check_json_syntax(package_json):
-                print(f"{Colors.GREEN}  ✅ {package_json}{Colors.END}")
-                self.check_package_json(package_json)
-            else:
-                print(f"{Colors.RED}  ❌ {package_json}{Colors.END}")
-        else:
-            self.errors.append(f"Missing file: {package_json}")
-            print(f"{Colors.RED}  ❌ {package_json} (missing){Colors.END}")
-        
-        # Check main React files
         react_files = [
             'frontend/src/App.jsx',
             'frontend/src/main.jsx',
@@ -209,41 +484,58 @@ class SystemChecker:
             'frontend/src/components/LoadingSpinner.jsx',
             'frontend/src/components/DocumentComparison.jsx'
         ]
+        config_files = [
+            'frontend/vite.config.js',
+            'frontend/tailwind.config.js',
+            'frontend/postcss.config.js'
+        ]
+        
+        # Parse everything up front; results are reported below in file order
+        jobs = [('json', package_json, self.check_json_syntax)]
+        jobs += [('javascript', path, self.check_javascript_syntax) for path in react_files + config_files]
+        results = self._check_files([job for job in jobs if self._exists(job[1])])
         
+        # Check package.json
+        if package_json in results:
+            if self._merge_result(results[package_json]):
+                self._emit(f"{Colors.GREEN}  ✅ {package_json}{Colors.END}")
+                self.check_package_json(package_json)
+            else:
+                self._emit(f"{Colors.RED}  ❌ {package_json}{Colors.END}")
+        else:
+            self.errors.append(f"Missing file: {package_json}")
+            self._emit(f"{Colors.RED}  ❌ {package_json} (missing){Colors.END}")
+        
+        # Check main React files
         all_good = True
         for file_path in react_files:
-            if os.path.exists(file_path):
-                if self.check_javascript_syntax(file_path):
-                    print(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
+            if file_path in results:
+                if self._merge_result(results[file_path]):
+                    self._emit(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
                 else:
                     all_good = False
-                    print(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
+                    self._emit(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
             else:
                 self.warnings.append(f"Missing file: {file_path}")
-                print(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
+                self._emit(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
         
         # Check config files
-        config_files = [
-            'frontend/vite.config.js',
-            'frontend/tailwind.config.js',
-            'frontend/postcss.config.js'
-        ]
-        
         for file_path in config_files:
-            if os.path.exists(file_path):
-                if self.check_javascript_syntax(file_path):
-                    print(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
+            if file_path in results:
+                if self._merge_result(results[file_path]):
+                    self._emit(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
                 else:
                     all_good = False
-                    print(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
+                    self._emit(f"{Colors.RED}  ❌ {file_path}{Colors.END}")
             else:
                 self.warnings.append(f"Missing config file: {file_path}")
-                print(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
+                self._emit(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
         
         return all_good
 
     def check_package_json(self, file_path: str):
         """Check package.json for required dependencies"""
+        import json
         try:
             with open(file_path, 'r') as f:
                 package_data = json.load(f)
@@ -268,47 +560,50 @@ class SystemChecker:
         except Exception as e:
             self.warnings.append(f"Could not validate package.json: {e}")
 
+    @phase("⚙️ Checking environment configuration...")
     def check_environment_files(self):
         """Check environment configuration"""
-        print(f"{Colors.BLUE}⚙️ Checking environment configuration...{Colors.END}")
-        
         # Check env.example
-        if os.path.exists('env.example'):
-            print(f"{Colors.GREEN}  ✅ env.example{Colors.END}")
+        if self._exists('env.example'):
+            self._emit(f"{Colors.GREEN}  ✅ env.example{Colors.END}")
         else:
             self.warnings.append("Missing env.example file")
-            print(f"{Colors.YELLOW}  ⚠️ env.example (missing){Colors.END}")
+            self._emit(f"{Colors.YELLOW}  ⚠️ env.example (missing){Colors.END}")
         
         # Check .env
-        if os.path.exists('.env'):
-            print(f"{Colors.GREEN}  ✅ .env{Colors.END}")
+        if self._exists('.env'):
+            self._emit(f"{Colors.GREEN}  ✅ .env{Colors.END}")
             self.validate_env_file('.env')
         else:
             self.info.append("No .env file found - will be created during setup")
-            print(f"{Colors.CYAN}  ℹ️ .env (will be created){Colors.END}")
+            self._emit(f"{Colors.CYAN}  ℹ️ .env (will be created){Colors.END}")
 
     def validate_env_file(self, file_path: str):
         """Validate .env file contents"""
         try:
+            # Record which variables and markers appear, one line at a time
+            found = set()
             with open(file_path, 'r') as f:
-                content = f.read()
+                for line in f:
+                    for match in _ENV_PROBE.finditer(line):
+                        if match.lastgroup == 'placeholder':
+                            found.add('your_')
+                        else:
+                            found.add(match.group('var'))
+                            if match.group('assign'):
+                                found.add(match.group('var') + match.group('assign'))
             
             # Check for required variables
-            required_vars = ['USE_LOCAL_NLP', 'FLASK_ENV', 'FLASK_DEBUG']
-            missing_vars = []
-            
-            for var in required_vars:
-                if var not in content:
-                    missing_vars.append(var)
+            missing_vars = [var for var in ENV_REQUIRED_VARS if var not in found]
             
             if missing_vars:
                 self.warnings.append(f"Missing environment variables: {', '.join(missing_vars)}")
             
             # Check USE_LOCAL_NLP setting
-            if 'USE_LOCAL_NLP=true' in content:
+            if 'USE_LOCAL_NLP=true' in found:
                 self.info.append("Using local NLP models (free, private)")
-            elif 'USE_LOCAL_NLP=false' in content:
-                if 'GEMINI_API_KEY=' not in content or 'your_' in content:
+            elif 'USE_LOCAL_NLP=false' in found:
+                if 'GEMINI_API_KEY=' not in found or 'your_' in found:
                     self.warnings.append("Gemini API mode enabled but no valid API key found")
                 else:
                     self.info.append("Using Gemini API (requires internet and billing)")
@@ -316,60 +611,60 @@ class SystemChecker:
         except Exception as e:
             self.warnings.append(f"Could not validate .env file: {e}")
 
+    @phase("🔧 Checking system dependencies...")
     def check_system_dependencies(self):
         """Check system-level dependencies"""
-        print(f"{Colors.BLUE}🔧 Checking system dependencies...{Colors.END}")
-        
         # Check Python
         version = sys.version_info
         if version.major >= 3 and version.minor >= 8:
-            print(f"{Colors.GREEN}  ✅ Python {version.major}.{version.minor}.{version.micro}{Colors.END}")
+            self._emit(f"{Colors.GREEN}  ✅ Python {version.major}.{version.minor}.{version.micro}{Colors.END}")
         else:
             self.errors.append("Python 3.8+ required")
-            print(f"{Colors.RED}  ❌ Python {version.major}.{version.minor}.{version.micro} (upgrade needed){Colors.END}")
+            self._emit(f"{Colors.RED}  ❌ Python {version.major}.{version.minor}.{version.micro} (upgrade needed){Colors.END}")
+        
+        # Spawn all tool probes at once; results are reported in a fixed order
+        with ThreadPoolExecutor(max_workers=len(SYSTEM_PROBES)) as executor:
+            futures = {name: executor.submit(_probe, cmd) for name, cmd in SYSTEM_PROBES.items()}
+            probes = {name: future.result() for name, future in futures.items()}
         
         # Check Node.js
-        try:
-            result = subprocess.run(['node', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                print(f"{Colors.GREEN}  ✅ Node.js {version}{Colors.END}")
-            else:
-                self.errors.append("Node.js not found")
-                print(f"{Colors.RED}  ❌ Node.js (not found){Colors.END}")
-        except FileNotFoundError:
+        result = probes['node']
+        if result is None:
             self.errors.append("Node.js not installed")
-            print(f"{Colors.RED}  ❌ Node.js (not installed){Colors.END}")
+            self._emit(f"{Colors.RED}  ❌ Node.js (not installed){Colors.END}")
+        elif result.returncode == 0:
+            version = result.stdout.strip()
+            self._emit(f"{Colors.GREEN}  ✅ Node.js {version}{Colors.END}")
+        else:
+            self.errors.append("Node.js not found")
+            self._emit(f"{Colors.RED}  ❌ Node.js (not found){Colors.END}")
         
         # Check Tesseract
-        try:
-            result = subprocess.run(['tesseract', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                print(f"{Colors.GREEN}  ✅ {version_line}{Colors.END}")
-            else:
-                self.errors.append("Tesseract OCR not working")
-                print(f"{Colors.RED}  ❌ Tesseract OCR (not working){Colors.END}")
-        except FileNotFoundError:
+        result = probes['tesseract']
+        if result is None:
             self.errors.append("Tesseract OCR not installed")
-            print(f"{Colors.RED}  ❌ Tesseract OCR (not installed){Colors.END}")
+            self._emit(f"{Colors.RED}  ❌ Tesseract OCR (not installed){Colors.END}")
+        elif result.returncode == 0:
+            version_line = result.stdout.split('\n')[0]
+            self._emit(f"{Colors.GREEN}  ✅ {version_line}{Colors.END}")
+        else:
+            self.errors.append("Tesseract OCR not working")
+            self._emit(f"{Colors.RED}  ❌ Tesseract OCR (not working){Colors.END}")
         
         # Check Poppler (optional)
-        try:
-            result = subprocess.run(['pdftoppm', '-h'], capture_output=True, text=True)
-            if result.returncode == 0 or 'pdftoppm' in result.stderr:
-                print(f"{Colors.GREEN}  ✅ Poppler utilities{Colors.END}")
-            else:
-                self.warnings.append("Poppler not found (PDF processing may fail)")
-                print(f"{Colors.YELLOW}  ⚠️ Poppler (not found){Colors.END}")
-        except FileNotFoundError:
+        result = probes['poppler']
+        if result is None:
             self.warnings.append("Poppler not installed (PDF processing may fail)")
-            print(f"{Colors.YELLOW}  ⚠️ Poppler (not installed){Colors.END}")
+            self._emit(f"{Colors.YELLOW}  ⚠️ Poppler (not installed){Colors.END}")
+        elif result.returncode == 0 or 'pdftoppm' in result.stderr:
+            self._emit(f"{Colors.GREEN}  ✅ Poppler utilities{Colors.END}")
+        else:
+            self.warnings.append("Poppler not found (PDF processing may fail)")
+            self._emit(f"{Colors.YELLOW}  ⚠️ Poppler (not found){Colors.END}")
 
+    @phase("📁 Checking project structure...")
     def check_project_structure(self):
         """Check overall project structure"""
-        print(f"{Colors.BLUE}📁 Checking project structure...{Colors.END}")
-        
         required_dirs = [
             'backend',
             'backend/utils',
@@ -380,11 +675,11 @@ class SystemChecker:
         ]
         
         for dir_path in required_dirs:
-            if os.path.exists(dir_path) and os.path.isdir(dir_path):
-                print(f"{Colors.GREEN}  ✅ {dir_path}//{Colors.END}")
+            if self._exists(dir_path, is_dir=True):
+                self._emit(f"{Colors.GREEN}  ✅ {dir_path}//{Colors.END}")
             else:
                 self.errors.append(f"Missing directory: {dir_path}")
-                print(f"{Colors.RED}  ❌ {dir_path}/ (missing){Colors.END}")
+                self._emit(f"{Colors.RED}  ❌ {dir_path}/ (missing){Colors.END}")
         
         # Check important files
         important_files = [
@@ -395,46 +690,42 @@ class SystemChecker:
         ]
         
         for file_path in important_files:
-            if os.path.exists(file_path):
-                print(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
+            if self._exists(file_path):
+                self._emit(f"{Colors.GREEN}  ✅ {file_path}{Colors.END}")
             else:
                 self.warnings.append(f"Missing file: {file_path}")
-                print(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
+                self._emit(f"{Colors.YELLOW}  ⚠️ {file_path} (missing){Colors.END}")
 
+    @phase("🔍 Checking for potential issues...")
     def check_potential_issues(self):
         """Check for potential runtime issues"""
-        print(f"{Colors.BLUE}🔍 Checking for potential issues...{Colors.END}")
-        
         issues_found = False
         
         # Check for common port conflicts
         try:
-            import socket
+            # Test if ports are available, probing both at once
+            with ThreadPoolExecutor(max_workers=len(SERVICE_PORTS)) as executor:
+                in_use = list(executor.map(_port_in_use, SERVICE_PORTS))
             
-            # Test if ports are available
-            for port, service in [(3000, "Frontend"), (5000, "Backend")]:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                result = sock.connect_ex(('localhost', port))
-                if result == 0:
+            for (port, service), busy in zip(SERVICE_PORTS.items(), in_use):
+                if busy:
                     self.warnings.append(f"Port {port} is already in use ({service} may conflict)")
-                    print(f"{Colors.YELLOW}  ⚠️ Port {port} in use{Colors.END}")
+                    self._emit(f"{Colors.YELLOW}  ⚠️ Port {port} in use{Colors.END}")
                     issues_found = True
                 else:
-                    print(f"{Colors.GREEN}  ✅ Port {port} available{Colors.END}")
-                sock.close()
+                    self._emit(f"{Colors.GREEN}  ✅ Port {port} available{Colors.END}")
         except Exception as e:
             self.warnings.append(f"Could not check port availability: {e}")
         
         # Check disk space for model downloads
         try:
-            import shutil
             free_space = shutil.disk_usage('.').free / (1024**3)  # GB
             if free_space < 5:
                 self.warnings.append(f"Low disk space ({free_space:.1f}GB). NLP models need ~3GB.")
-                print(f"{Colors.YELLOW}  ⚠️ Low disk space ({free_space:.1f}GB){Colors.END}")
+                self._emit(f"{Colors.YELLOW}  ⚠️ Low disk space ({free_space:.1f}GB){Colors.END}")
                 issues_found = True
             else:
-                print(f"{Colors.GREEN}  ✅ Sufficient disk space ({free_space:.1f}GB){Colors.END}")
+                self._emit(f"{Colors.GREEN}  ✅ Sufficient disk space ({free_space:.1f}GB){Colors.END}")
         except Exception as e:
             self.warnings.append(f"Could not check disk space: {e}")
         
@@ -445,70 +736,65 @@ class SystemChecker:
             total_gb = memory.total / (1024**3)
             if total_gb < 4:
                 self.warnings.append(f"Low RAM ({total_gb:.1f}GB). Local NLP models may be slow.")
-                print(f"{Colors.YELLOW}  ⚠️ Low RAM ({total_gb:.1f}GB){Colors.END}")
+                self._emit(f"{Colors.YELLOW}  ⚠️ Low RAM ({total_gb:.1f}GB){Colors.END}")
                 issues_found = True
             else:
-                print(f"{Colors.GREEN}  ✅ Sufficient RAM ({total_gb:.1f}GB){Colors.END}")
+                self._emit(f"{Colors.GREEN}  ✅ Sufficient RAM ({total_gb:.1f}GB){Colors.END}")
         except ImportError:
             self.info.append("Install 'psutil' for memory checking")
         except Exception as e:
             self.warnings.append(f"Could not check memory: {e}")
         
         if not issues_found:
-            print(f"{Colors.GREEN}  ✅ No obvious issues detected{Colors.END}")
+            self._emit(f"{Colors.GREEN}  ✅ No obvious issues detected{Colors.END}")
+
+    def _emit_list(self, title: str, items: List[str], color: str):
+        """Queue a numbered summary section as one joined block"""
+        if items:
+            lines = [f"{color}{Colors.BOLD}{title} ({len(items)}):{Colors.END}"]
+            lines += [f"{color}  {i}. {item}{Colors.END}" for i, item in enumerate(items, 1)]
+            lines.append("")
+            self._emit("\n".join(lines))
 
     def print_summary(self):
         """Print comprehensive summary"""
-        print(f"\n{Colors.CYAN}{Colors.BOLD}")
-        print("=" * 70)
-        print("  SYSTEM CHECK SUMMARY")
-        print("=" * 70)
-        print(f"{Colors.END}")
+        self._emit(f"\n{Colors.CYAN}{Colors.BOLD}")
+        self._emit("=" * 70)
+        self._emit("  SYSTEM CHECK SUMMARY")
+        self._emit("=" * 70)
+        self._emit(f"{Colors.END}")
         
         # Count issues
         total_issues = len(self.errors) + len(self.warnings)
         
-        if self.errors:
-            print(f"{Colors.RED}{Colors.BOLD}❌ CRITICAL ERRORS ({len(self.errors)}):{Colors.END}")
-            for i, error in enumerate(self.errors, 1):
-                print(f"{Colors.RED}  {i}. {error}{Colors.END}")
-            print()
-        
-        if self.warnings:
-            print(f"{Colors.YELLOW}{Colors.BOLD}⚠️ WARNINGS ({len(self.warnings)}):{Colors.END}")
-            for i, warning in enumerate(self.warnings, 1):
-                print(f"{Colors.YELLOW}  {i}. {warning}{Colors.END}")
-            print()
-        
-        if self.info:
-            print(f"{Colors.CYAN}{Colors.BOLD}ℹ️ INFORMATION ({len(self.info)}):{Colors.END}")
-            for i, info in enumerate(self.info, 1):
-                print(f"{Colors.CYAN}  {i}. {info}{Colors.END}")
-            print()
+        self._emit_list("❌ CRITICAL ERRORS", self.errors, Colors.RED)
+        self._emit_list("⚠️ WARNINGS", self.warnings, Colors.YELLOW)
+        self._emit_list("ℹ️ INFORMATION", self.info, Colors.CYAN)
         
         # Overall status
         if self.errors:
-            print(f"{Colors.RED}{Colors.BOLD}❌ SYSTEM CHECK FAILED{Colors.END}")
-            print(f"{Colors.RED}Please fix the critical errors before proceeding.{Colors.END}")
-            print(f"{Colors.WHITE}Run: python setup.py to automatically fix most issues.{Colors.END}")
+            self._emit(f"{Colors.RED}{Colors.BOLD}❌ SYSTEM CHECK FAILED{Colors.END}")
+            self._emit(f"{Colors.RED}Please fix the critical errors before proceeding.{Colors.END}")
+            self._emit(f"{Colors.WHITE}Run: python setup.py to automatically fix most issues.{Colors.END}")
             return False
         elif self.warnings:
-            print(f"{Colors.YELLOW}{Colors.BOLD}⚠️ SYSTEM CHECK PASSED WITH WARNINGS{Colors.END}")
-            print(f"{Colors.YELLOW}The system should work, but consider addressing the warnings.{Colors.END}")
-            print(f"{Colors.WHITE}Run: python setup.py to automatically fix most issues.{Colors.END}")
+            self._emit(f"{Colors.YELLOW}{Colors.BOLD}⚠️ SYSTEM CHECK PASSED WITH WARNINGS{Colors.END}")
+            self._emit(f"{Colors.YELLOW}The system should work, but consider addressing the warnings.{Colors.END}")
+            self._emit(f"{Colors.WHITE}Run: python setup.py to automatically fix most issues.{Colors.END}")
             return True
         else:
-            print(f"{Colors.GREEN}{Colors.BOLD}✅ SYSTEM CHECK PASSED{Colors.END}")
-            print(f"{Colors.GREEN}Everything looks good! You can start the application.{Colors.END}")
+            self._emit(f"{Colors.GREEN}{Colors.BOLD}✅ SYSTEM CHECK PASSED{Colors.END}")
+            self._emit(f"{Colors.GREEN}Everything looks good! You can start the application.{Colors.END}")
             if self.system == 'windows':
-                print(f"{Colors.WHITE}Run: start-dev.bat{Colors.END}")
+                self._emit(f"{Colors.WHITE}Run: start-dev.bat{Colors.END}")
             else:
-                print(f"{Colors.WHITE}Run: ./start-dev.sh{Colors.END}")
+                self._emit(f"{Colors.WHITE}Run: ./start-dev.sh{Colors.END}")
             return True
 
     def run_full_check(self):
         """Run all system checks"""
         self.print_header()
+        self._flush()
         
         checks = [
             self.check_system_dependencies,
@@ -519,15 +805,17 @@ class SystemChecker:
             self.check_potential_issues
         ]
         
-        for check in checks:
-            try:
+        try:
+            for check in checks:
                 check()
-                print()  # Add spacing
-            except Exception as e:
-                self.errors.append(f"Unexpected error in {check.__name__}: {e}")
-                print(f"{Colors.RED}❌ Error in {check.__name__}: {e}{Colors.END}\n")
-        
-        return self.print_summary()
+                self._emit()  # Add spacing
+                self._flush()
+        finally:
+            self._save_manifest()
+        
+        success = self.print_summary()
+        self._flush()
+        return success
 
 def main():
     """Main entry point"""
@@ -6,9 +6,11 @@ Simple utility to help users find their IP address for mobile testing.
 
 import socket
 import platform
-import subprocess
 import sys
 
+# Host OS, resolved once per process
+SYSTEM = platform.system().lower()
+
 class Colors:
     PURPLE = '\033[95m'
     CYAN = '\033[96m'
@@ -20,39 +22,101 @@ class Colors:
     WHITE = '\033[37m'
     END = '\033[0m'
 
+# UDP connect() only does a local route lookup, so it either succeeds fast or not at all
+IP_PROBE_TIMEOUT = 0.2
+
 def get_local_ip():
     """Get the local IP address"""
     try:
         # Connect to a remote address to determine local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
-        return "Unable to determine"
-
-def get_all_ips():
-    """Get all available IP addresses"""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(IP_PROBE_TIMEOUT)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        pass
+    
+    # No usable route; fall back to whatever the hostname resolves to
     try:
-        if platform.system().lower() == 'windows':
-            result = subprocess.run(['ipconfig'], capture_output=True, text=True)
-            return result.stdout
-        else:
-            result = subprocess.run(['ifconfig'], capture_output=True, text=True)
-            return result.stdout
-    except Exception:
-        return "Unable to get network information"
+        ip = socket.gethostbyname(socket.gethostname())
+        if not ip.startswith('127.'):
+            return ip
+    except OSError:
+        pass
+    return "Unable to determine"
+
+def _block(*lines):
+    """Pre-color (color, text) lines into one output block; color None is plain text"""
+    return "".join(f"{color}{text}{Colors.END}\n" if color else f"{text}\n" for color, text in lines)
+
+# Output is assembled once at import; main() only fills in the {placeholders}
+IP_BLOCK = _block(
+    (Colors.GREEN, "🌐 Your IP Address for Mobile Testing:"),
+    (Colors.CYAN, "  {ip}"),
+    (None, ""),
+)
+
+ACCESS_BLOCK = _block(
+    (Colors.WHITE, "📱 Mobile Access URLs:"),
+    (Colors.CYAN, "  • Frontend: {frontend_url}"),
+    (Colors.CYAN, "  • Backend:  {backend_url}"),
+    (None, ""),
+    (Colors.YELLOW, "📋 Instructions for Mobile Testing:"),
+    (Colors.WHITE, "1. Make sure your mobile device is on the same WiFi network"),
+    (Colors.WHITE, "2. Open your mobile browser"),
+    (Colors.WHITE, "3. Navigate to: {frontend_url}"),
+    (Colors.WHITE, "4. For PWA: Tap menu → 'Add to Home Screen'"),
+    (None, ""),
+    (Colors.GREEN, "✨ Pro Tips:"),
+    (Colors.CYAN, "  • Install as PWA for native app experience"),
+    (Colors.CYAN, "  • Test offline mode by disabling WiFi after loading"),
+    (Colors.CYAN, "  • Use touch gestures for optimal mobile experience"),
+    (Colors.CYAN, "  • Check responsive design on different screen sizes"),
+)
+
+if SYSTEM == 'windows':
+    _MANUAL_LOOKUP = (
+        (Colors.CYAN, "Windows - Run in Command Prompt:"),
+        (Colors.WHITE, "  ipconfig"),
+        (Colors.WHITE, "  Look for 'IPv4 Address' under your network adapter"),
+    )
+else:
+    _MANUAL_LOOKUP = (
+        (Colors.CYAN, "Mac/Linux - Run in Terminal:"),
+        (Colors.WHITE, "  ifconfig"),
+        (Colors.WHITE, "  Look for 'inet' address (usually starts with 192.168.x.x)"),
+    )
+
+FALLBACK_BLOCK = _block(
+    (Colors.RED, "❌ Could not determine IP address automatically."),
+    (Colors.WHITE, "Try these methods:"),
+    (None, ""),
+    *_MANUAL_LOOKUP,
+    (None, ""),
+    (Colors.WHITE, "Common IP ranges:"),
+    (Colors.CYAN, "  • 192.168.1.x (most home routers)"),
+    (Colors.CYAN, "  • 192.168.0.x (some routers)"),
+    (Colors.CYAN, "  • 10.0.0.x (some networks)"),
+)
+
+FOOTER_BLOCK = _block(
+    (None, ""),
+    (Colors.PURPLE, "🔥 Ready to test your mobile-optimized OCR processor!"),
+)
+
+BANNER = (
+    f"{Colors.PURPLE}{Colors.BOLD}\n"
+    + "╔" + "═" * 60 + "╗\n"
+    + "║" + " " * 60 + "║\n"
+    + "║" + "  📱 MOBILE IP FINDER - OCR PROCESSOR  ".center(60) + "║\n"
+    + "║" + " " * 60 + "║\n"
+    + "╚" + "═" * 60 + "╝\n"
+    + f"{Colors.END}\n\n"
+)
 
 def print_banner():
     """Print welcome banner"""
-    print(f"{Colors.PURPLE}{Colors.BOLD}")
-    print("╔" + "═" * 60 + "╗")
-    print("║" + " " * 60 + "║")
-    print("║" + "  📱 MOBILE IP FINDER - OCR PROCESSOR  ".center(60) + "║")
-    print("║" + " " * 60 + "║")
-    print("╚" + "═" * 60 + "╝")
-    print(f"{Colors.END}\n")
+    sys.stdout.write(BANNER)
 
 def main():
     """Main entry point"""
@@ -61,50 +125,15 @@ def main():
     # Get local IP
     local_ip = get_local_ip()
     
-    print(f"{Colors.GREEN}🌐 Your IP Address for Mobile Testing:{Colors.END}")
-    print(f"{Colors.CYAN}  {local_ip}{Colors.END}")
-    print()
+    sys.stdout.write(IP_BLOCK.format(ip=local_ip))
     
     if local_ip != "Unable to determine":
-        print(f"{Colors.WHITE}📱 Mobile Access URLs:{Colors.END}")
-        print(f"{Colors.CYAN}  • Frontend: http://{local_ip}:3000{Colors.END}")
-        print(f"{Colors.CYAN}  • Backend:  http://{local_ip}:5000{Colors.END}")
-        print()
-        
-        print(f"{Colors.YELLOW}📋 Instructions for Mobile Testing:{Colors.END}")
-        print(f"{Colors.WHITE}1. Make sure your mobile device is on the same WiFi network{Colors.END}")
-        print(f"{Colors.WHITE}2. Open your mobile browser{Colors.END}")
-        print(f"{Colors.WHITE}3. Navigate to: http://{local_ip}:3000{Colors.END}")
-        print(f"{Colors.WHITE}4. For PWA: Tap menu → 'Add to Home Screen'{Colors.END}")
-        print()
-        
-        print(f"{Colors.GREEN}✨ Pro Tips:{Colors.END}")
-        print(f"{Colors.CYAN}  • Install as PWA for native app experience{Colors.END}")
-        print(f"{Colors.CYAN}  • Test offline mode by disabling WiFi after loading{Colors.END}")
-        print(f"{Colors.CYAN}  • Use touch gestures for optimal mobile experience{Colors.END}")
-        print(f"{Colors.CYAN}  • Check responsive design on different screen sizes{Colors.END}")
+        sys.stdout.write(ACCESS_BLOCK.format(frontend_url=f"http://{local_ip}:3000",
+                                             backend_url=f"http://{local_ip}:5000"))
     else:
-        print(f"{Colors.RED}❌ Could not determine IP address automatically.{Colors.END}")
-        print(f"{Colors.WHITE}Try these methods:{Colors.END}")
-        print()
-        
-        if platform.system().lower() == 'windows':
-            print(f"{Colors.CYAN}Windows - Run in Command Prompt:{Colors.END}")
-            print(f"{Colors.WHITE}  ipconfig{Colors.END}")
-            print(f"{Colors.WHITE}  Look for 'IPv4 Address' under your network adapter{Colors.END}")
-        else:
-            print(f"{Colors.CYAN}Mac/Linux - Run in Terminal:{Colors.END}")
-            print(f"{Colors.WHITE}  ifconfig{Colors.END}")
-            print(f"{Colors.WHITE}  Look for 'inet' address (usually starts with 192.168.x.x){Colors.END}")
-        
-        print()
-        print(f"{Colors.WHITE}Common IP ranges:{Colors.END}")
-        print(f"{Colors.CYAN}  • 192.168.1.x (most home routers){Colors.END}")
-        print(f"{Colors.CYAN}  • 192.168.0.x (some routers){Colors.END}")
-        print(f"{Colors.CYAN}  • 10.0.0.x (some networks){Colors.END}")
+        sys.stdout.write(FALLBACK_BLOCK)
     
-    print()
-    print(f"{Colors.PURPLE}🔥 Ready to test your mobile-optimized OCR processor!{Colors.END}")
+    sys.stdout.write(FOOTER_BLOCK)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -9,13 +9,72 @@ import subprocess
 import sys
 import os
 import platform
+import tempfile
+import asyncio
+import importlib
+import time
+import re
+from importlib.metadata import version as installed_version, PackageNotFoundError
 
-def run_command(command, description=""):
-    """Run a command and handle errors"""
+try:
+    from packaging.requirements import Requirement
+    PACKAGING_SUPPORT = True
+except ImportError:
+    PACKAGING_SUPPORT = False
+
+# Host OS, resolved once per process
+SYSTEM = platform.system().lower()
+
+# One pip process for the whole package list: single resolver pass, no per-package startup
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--prefer-binary",
+               "--no-input", "--disable-pip-version-check"]
+
+# apt's package cache; "apt update" is skipped while it is younger than this
+APT_PKGCACHE = "/var/cache/apt/pkgcache.bin"
+APT_CACHE_MAX_AGE = 24 * 60 * 60
+
+def apt_cache_is_fresh():
+    """True if apt's package lists were refreshed within APT_CACHE_MAX_AGE"""
+    try:
+        return time.time() - os.path.getmtime(APT_PKGCACHE) < APT_CACHE_MAX_AGE
+    except OSError:
+        return False
+
+def _version_key(text):
+    """Numeric release tuple for a version string, e.g. "4.8.1.78" -> (4, 8, 1, 78)"""
+    parts = []
+    for part in text.split("."):
+        digits = re.match(r"\d+", part)
+        if not digits:
+            break
+        parts.append(int(digits.group()))
+    return tuple(parts)
+
+def is_installed(spec):
+    """True if the "name>=version" requirement is already met in this environment"""
+    if PACKAGING_SUPPORT:
+        requirement = Requirement(spec)
+        name, specifier = requirement.name, requirement.specifier
+    else:
+        name, _, minimum = spec.partition(">=")
+    try:
+        current = installed_version(name)
+    except PackageNotFoundError:
+        return False
+    if PACKAGING_SUPPORT:
+        return specifier.contains(current, prereleases=True)
+    return _version_key(current) >= _version_key(minimum)
+
+def run_command(command, description="", capture=True):
+    """Run a command (shell string or argument list) and handle errors
+
+    Long installs pass capture=False so their progress streams straight to the terminal.
+    """
     print(f"\n🔧 {description}")
-    print(f"Running: {command}")
+    print(f"Running: {command if isinstance(command, str) else ' '.join(command)}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, shell=isinstance(command, str), check=True,
+                                capture_output=capture, text=True)
         print("✅ Success!")
         if result.stdout:
             print(result.stdout)
@@ -25,6 +84,32 @@ def run_command(command, description=""):
         if e.stderr:
             print(f"Error details: {e.stderr}")
         return False
+    except OSError as e:
+        print(f"❌ Error: {e}")
+        return False
+
+async def run_command_async(command, description=""):
+    """Run an argument list without blocking other commands; output is printed once it exits"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        stdout, stderr = await proc.communicate()
+    except OSError as e:
+        print(f"\n🔧 {description}")
+        print(f"❌ Error: {e}")
+        return False
+    
+    print(f"\n🔧 {description}")
+    print(f"Running: {' '.join(command)}")
+    if proc.returncode == 0:
+        print("✅ Success!")
+        if stdout:
+            print(stdout.decode(errors="replace"))
+        return True
+    print(f"❌ Error: exit status {proc.returncode}")
+    if stderr:
+        print(f"Error details: {stderr.decode(errors='replace')}")
+    return False
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -72,7 +157,6 @@ def install_pip_packages():
         "odfpy>=1.4.1",
         
         # HTML/XML Processing
-        "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
         
         # Text Processing
@@ -91,24 +175,62 @@ def install_pip_packages():
         "PyJWT>=2.3.0"
     ]
     
+    # Checking installed metadata locally avoids pip's PyPI round-trips on reruns
+    packages = [package for package in packages if not is_installed(package)]
+    if not packages:
+        print("\n✅ All Python packages are already installed")
+        return True
+    
     print(f"\n📦 Installing {len(packages)} Python packages...")
     
+    # delete=False so pip can reopen the file on Windows
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(packages))
+    try:
+        if run_command(PIP_INSTALL + ["-r", f.name], "Installing all packages in one pass",
+                       capture=False):
+            return True
+    finally:
+        os.unlink(f.name)
+    
+    # One bad package fails the whole batch; retry individually so the rest still install
+    print("⚠️  Batch install failed, installing packages one at a time...")
     for package in packages:
-        if not run_command(f"pip install {package}", f"Installing {package}"):
+        if not run_command(PIP_INSTALL + [package], f"Installing {package}", capture=False):
             print(f"⚠️  Failed to install {package}, continuing with others...")
     
     return True
 
-def install_spacy_model():
-    """Install spaCy English model"""
-    print("\n🧠 Installing spaCy English model...")
-    return run_command("python -m spacy download en_core_web_sm", "Downloading spaCy English model")
+SPACY_MODEL_JOB = ([sys.executable, "-m", "spacy", "download", "en_core_web_sm"],
+                   "Downloading spaCy English model")
+
+NLTK_DOWNLOADS = [
+    "punkt",
+    "stopwords",
+    "wordnet",
+    "averaged_perceptron_tagger"
+]
+
+# Homebrew formulae for OCR, PDF rendering and DOC extraction
+BREW_FORMULAE = ["tesseract", "poppler", "antiword"]
+
+def install_brew_formulae(formulae):
+    """Install formulae with one Homebrew dependency resolve via a temporary Brewfile"""
+    with tempfile.NamedTemporaryFile("w", suffix=".Brewfile", delete=False) as f:
+        f.write("".join(f'brew "{formula}"\n' for formula in formulae))
+    try:
+        if run_command(["brew", "bundle", "--file", f.name], "Installing Homebrew formulae",
+                       capture=False):
+            return True
+    finally:
+        os.unlink(f.name)
+    
+    # Older Homebrew without bundle: a single install still resolves everything at once
+    return run_command(["brew", "install"] + formulae, "Installing Homebrew formulae", capture=False)
 
 def install_system_dependencies():
     """Install system dependencies based on OS"""
-    system = platform.system().lower()
-    
-    if system == "windows":
+    if SYSTEM == "windows":
         print("\n🖥️  Windows detected - Installing system dependencies...")
         print("Please install the following manually:")
         print("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
@@ -117,39 +239,58 @@ def install_system_dependencies():
         print("\nAlternatively, if you have Chocolatey installed:")
         print("Run as Administrator: choco install tesseract poppler")
         
-    elif system == "darwin":  # macOS
+    elif SYSTEM == "darwin":  # macOS
         print("\n🍎 macOS detected - Installing system dependencies...")
-        if run_command("brew --version", "Checking for Homebrew"):
-            run_command("brew install tesseract poppler", "Installing Tesseract and Poppler")
-            run_command("brew install antiword", "Installing antiword for DOC files")
+        if run_command(["brew", "--version"], "Checking for Homebrew"):
+            install_brew_formulae(BREW_FORMULAE)
         else:
             print("Please install Homebrew first: https://brew.sh/")
             
-    elif system == "linux":
+    elif SYSTEM == "linux":
         print("\n🐧 Linux detected - Installing system dependencies...")
         # Try different package managers
-        if run_command("apt --version", "Checking for apt"):
-            run_command("sudo apt update", "Updating package list")
-            run_command("sudo apt install -y tesseract-ocr poppler-utils antiword", "Installing dependencies")
-        elif run_command("yum --version", "Checking for yum"):
-            run_command("sudo yum install -y tesseract poppler-utils antiword", "Installing dependencies")
-        elif run_command("pacman --version", "Checking for pacman"):
-            run_command("sudo pacman -S tesseract poppler antiword", "Installing dependencies")
+        if run_command(["apt", "--version"], "Checking for apt"):
+            if not apt_cache_is_fresh():
+                run_command(["sudo", "apt", "update"], "Updating package list", capture=False)
+            run_command(["sudo", "apt", "install", "-y", "tesseract-ocr", "poppler-utils", "antiword"],
+                        "Installing dependencies", capture=False)
+        elif run_command(["yum", "--version"], "Checking for yum"):
+            run_command(["sudo", "yum", "install", "-y", "tesseract", "poppler-utils", "antiword"],
+                        "Installing dependencies", capture=False)
+        elif run_command(["pacman", "--version"], "Checking for pacman"):
+            run_command(["sudo", "pacman", "-S", "tesseract", "poppler", "antiword"],
+                        "Installing dependencies", capture=False)
         else:
             print("Please install tesseract-ocr, poppler-utils, and antiword using your package manager")
 
 def download_nltk_data():
     """Download required NLTK data"""
     print("\n📚 Downloading NLTK data...")
-    nltk_downloads = [
-        "punkt",
-        "stopwords",
-        "wordnet",
-        "averaged_perceptron_tagger"
-    ]
+    try:
+        # NLTK may have been installed by pip earlier in this run
+        importlib.invalidate_caches()
+        import nltk
+    except ImportError:
+        print("❌ NLTK is not installed, skipping NLTK data")
+        return False
+    
+    # One in-process call fetches every package over a shared downloader
+    if nltk.download(NLTK_DOWNLOADS, quiet=True, raise_on_error=False):
+        print(f"✅ Downloaded NLTK data: {', '.join(NLTK_DOWNLOADS)}")
+        return True
+    print("⚠️  Some NLTK data failed to download")
+    return False
+
+def download_language_data():
+    """Download the spaCy model while NLTK data downloads in-process; both are network-bound"""
+    print("\n🧠 Downloading spaCy model and NLTK data...")
     
-    for data_name in nltk_downloads:
-        run_command(f"python -c \"import nltk; nltk.download('{data_name}')\"", f"Downloading {data_name}")
+    async def run_all():
+        spacy_download = asyncio.ensure_future(run_command_async(*SPACY_MODEL_JOB))
+        await asyncio.get_running_loop().run_in_executor(None, download_nltk_data)
+        return await spacy_download
+    
+    return asyncio.run(run_all())
 
 def create_test_script():
     """Create a test script to verify installation"""
@@ -158,6 +299,31 @@ def create_test_script():
 Test script to verify comprehensive file format support installation
 """
 
+import asyncio
+import importlib.util
+import sys
+
+# Modules whose import can still fail after installation (native extensions, torch);
+# they are really imported, each in its own process so the memory is released afterwards
+HEAVY_MODULES = {"pandas", "spacy", "easyocr"}
+
+async def import_in_subprocess(module_name):
+    """Import a module in a separate interpreter; returns an error message or None"""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", f"import {module_name}",
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+    _, stderr = await proc.communicate()
+    if proc.returncode == 0:
+        return None
+    lines = stderr.decode(errors="replace").strip().splitlines()
+    return lines[-1] if lines else f"exit status {proc.returncode}"
+
+def verify_heavy_imports(module_names):
+    """Import the given modules concurrently in subprocesses; returns {name: error or None}"""
+    async def run_all():
+        return await asyncio.gather(*(import_in_subprocess(name) for name in module_names))
+    return dict(zip(module_names, asyncio.run(run_all())))
+
 def test_imports():
     """Test if all required modules can be imported"""
     modules_to_test = [
@@ -167,7 +333,7 @@ def test_imports():
         ("docx", "Word document processing"),
         ("openpyxl", "Excel processing"),
         ("pptx", "PowerPoint processing"),
-        ("bs4", "HTML processing"),
+        ("lxml", "HTML processing"),
         ("pandas", "Data processing"),
         ("nltk", "Natural language processing"),
         ("spacy", "Advanced NLP"),
@@ -179,13 +345,20 @@ def test_imports():
     print("🧪 Testing module imports...")
     failed_imports = []
     
+    # find_spec locates each module without executing it (spacy, easyocr and
+    # pandas take seconds to import)
+    found = {name for name, _ in modules_to_test if importlib.util.find_spec(name) is not None}
+    import_errors = verify_heavy_imports(sorted(found & HEAVY_MODULES))
+    
     for module_name, description in modules_to_test:
-        try:
-            __import__(module_name)
-            print(f"✅ {module_name} - {description}")
-        except ImportError as e:
-            print(f"❌ {module_name} - {description} - Failed: {e}")
+        if module_name not in found:
+            print(f"❌ {module_name} - {description} - Not installed")
+            failed_imports.append(module_name)
+        elif import_errors.get(module_name):
+            print(f"❌ {module_name} - {description} - Failed: {import_errors[module_name]}")
             failed_imports.append(module_name)
+        else:
+            print(f"✅ {module_name} - {description}")
     
     if failed_imports:
         print(f"\\n⚠️  {len(failed_imports)} modules failed to import:")
@@ -199,7 +372,7 @@ def test_imports():
 
 def test_system_tools():
     """Test if system tools are available"""
-    import subprocess
+    import shutil
     
     tools_to_test = [
         ("tesseract", "Tesseract OCR"),
@@ -209,16 +382,11 @@ def test_system_tools():
     print("\\n🔧 Testing system tools...")
     failed_tools = []
     
+    # A PATH lookup is enough; no version is compared, so nothing is executed
     for tool_name, description in tools_to_test:
-        try:
-            result = subprocess.run([tool_name, "--version"], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                print(f"✅ {tool_name} - {description}")
-            else:
-                print(f"❌ {tool_name} - {description} - Not working")
-                failed_tools.append(tool_name)
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if shutil.which(tool_name):
+            print(f"✅ {tool_name} - {description}")
+        else:
             print(f"❌ {tool_name} - {description} - Not found")
             failed_tools.append(tool_name)
     
@@ -265,11 +433,8 @@ def main():
     # Install Python packages
     install_pip_packages()
     
-    # Install spaCy model
-    install_spacy_model()
-    
-    # Download NLTK data
-    download_nltk_data()
+    # Install spaCy model and download NLTK data
+    download_language_data()
     
     # Create test script
     create_test_script()
@@ -11,6 +11,87 @@ import subprocess
 import urllib.request
 import tempfile
 import shutil
+import time
+import glob
+
+# Host OS, resolved once per process
+SYSTEM = platform.system().lower()
+
+# Download buffer and timeout for traineddata files (tens of MB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 30
+
+def download_file(url, target):
+    """Stream url to target in large chunks, failing fast on a dead mirror"""
+    request = urllib.request.Request(url, headers={'Accept-Encoding': 'identity'})
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response, open(target, 'wb') as f:
+        shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+
+# Where each platform's Tesseract keeps its language data
+WINDOWS_TESSDATA_DIRS = [
+    r"C:\Program Files\Tesseract-OCR\tessdata",
+    r"C:\Program Files (x86)\Tesseract-OCR\tessdata",
+    r"C:\Users\{}\AppData\Local\Tesseract-OCR\tessdata".format(os.getenv('USERNAME')),
+    r"C:\tools\tesseract\tessdata"
+]
+LINUX_TESSDATA_DIRS = [
+    "/usr/share/tesseract-ocr/4.00/tessdata",
+    "/usr/share/tesseract-ocr/tessdata",
+    "/usr/share/tessdata",
+    "/opt/homebrew/share/tessdata"
+]
+MACOS_TESSDATA_DIRS = [
+    "/opt/homebrew/share/tessdata",
+    "/usr/local/share/tessdata",
+    "/usr/share/tessdata"
+]
+
+def windows_tessdata_dirs():
+    """Candidate tessdata dirs, starting with the one next to the tesseract on PATH"""
+    candidates = []
+    tesseract_exe = shutil.which("tesseract")
+    if tesseract_exe:
+        candidates.append(os.path.join(os.path.dirname(tesseract_exe), "tessdata"))
+    # Covers both "Program Files" and "Program Files (x86)"
+    candidates += glob.glob(r"C:\Program Files*\Tesseract-OCR\tessdata")
+    candidates += WINDOWS_TESSDATA_DIRS
+    return [path for path in dict.fromkeys(candidates) if os.path.isdir(path)]
+
+def find_hindi_traineddata(tessdata_dirs):
+    """Return the path of an existing hin.traineddata in tessdata_dirs, if any"""
+    for tessdata_dir in tessdata_dirs:
+        candidate = os.path.join(tessdata_dir, "hin.traineddata")
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+# apt's package cache; "apt update" is skipped while it is younger than this
+APT_PKGCACHE = "/var/cache/apt/pkgcache.bin"
+APT_CACHE_MAX_AGE = 24 * 60 * 60
+
+def apt_cache_is_fresh():
+    """True if apt's package lists were refreshed within APT_CACHE_MAX_AGE"""
+    try:
+        return time.time() - os.path.getmtime(APT_PKGCACHE) < APT_CACHE_MAX_AGE
+    except OSError:
+        return False
+
+# Copies a file next to its target and renames it into place, run under sudo
+_SUDO_ATOMIC_COPY = (
+    "import os, shutil, sys; partial = sys.argv[2] + '.partial'; "
+    "shutil.copyfile(sys.argv[1], partial); os.replace(partial, sys.argv[2])"
+)
+
+def download_into_place(url, target):
+    """Download next to target and rename over it, so Tesseract never sees a partial file"""
+    partial = target + ".partial"
+    try:
+        download_file(url, partial)
+        os.replace(partial, target)
+    except BaseException:
+        if os.path.exists(partial):
+            os.unlink(partial)
+        raise
 
 def print_status(message, status="info"):
     colors = {
@@ -30,11 +111,15 @@ def print_status(message, status="info"):
     
     print(f"{colors[status]}{symbols[status]} {message}{colors['reset']}")
 
-def run_command(command, description=""):
-    """Run a system command and return success status"""
+def run_command(command, description="", capture=True):
+    """Run a system command (shell string or argument list) and return success status
+
+    Package installs pass capture=False so their progress streams straight to the terminal.
+    """
     try:
         print_status(f"Running: {description or command}", "info")
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        result = subprocess.run(command, shell=isinstance(command, str),
+                                capture_output=capture, text=True)
         if result.returncode == 0:
             print_status(f"Success: {description or command}", "success")
             return True
@@ -60,10 +145,9 @@ def check_tesseract():
     
     print_status("Tesseract OCR not found!", "error")
     print("Please install Tesseract first:")
-    system = platform.system().lower()
-    if system == "windows":
+    if SYSTEM == "windows":
         print("Download from: https://github.com/UB-Mannheim/tesseract/wiki")
-    elif system == "darwin":
+    elif SYSTEM == "darwin":
         print("Run: brew install tesseract")
     else:
         print("Run: sudo apt install tesseract-ocr")
@@ -84,22 +168,17 @@ def install_hindi_windows():
     """Install Hindi language pack on Windows"""
     print_status("Installing Hindi language pack for Windows...", "info")
     
+    tessdata_dirs = windows_tessdata_dirs()
+    existing = find_hindi_traineddata(tessdata_dirs)
+    if existing:
+        print_status(f"Hindi language pack already present: {existing}", "success")
+        return True
+    
     # Download Hindi traineddata file
     hindi_url = "https://github.com/tesseract-ocr/tessdata_best/raw/main/hin.traineddata"
     
     # Find Tesseract installation directory
-    possible_paths = [
-        r"C:\Program Files\Tesseract-OCR\tessdata",
-        r"C:\Program Files (x86)\Tesseract-OCR\tessdata",
-        r"C:\Users\{}\AppData\Local\Tesseract-OCR\tessdata".format(os.getenv('USERNAME')),
-        r"C:\tools\tesseract\tessdata"
-    ]
-    
-    tessdata_dir = None
-    for path in possible_paths:
-        if os.path.exists(path):
-            tessdata_dir = path
-            break
+    tessdata_dir = tessdata_dirs[0] if tessdata_dirs else None
     
     if not tessdata_dir:
         print_status("Could not find Tesseract tessdata directory!", "error")
@@ -111,7 +190,7 @@ def install_hindi_windows():
     try:
         print_status(f"Downloading Hindi language pack to {tessdata_dir}...", "info")
         hindi_file = os.path.join(tessdata_dir, "hin.traineddata")
-        urllib.request.urlretrieve(hindi_url, hindi_file)
+        download_into_place(hindi_url, hindi_file)
         print_status("Hindi language pack installed successfully!", "success")
         return True
     except Exception as e:
@@ -122,16 +201,25 @@ def install_hindi_linux():
     """Install Hindi language pack on Linux"""
     print_status("Installing Hindi language pack for Linux...", "info")
     
+    existing = find_hindi_traineddata(LINUX_TESSDATA_DIRS)
+    if existing:
+        print_status(f"Hindi language pack already present: {existing}", "success")
+        return True
+    
     # Try package manager first
-    if run_command("sudo apt update", "Updating package list"):
-        if run_command("sudo apt install -y tesseract-ocr-hin", "Installing Hindi language pack"):
+    if apt_cache_is_fresh() or run_command(["sudo", "apt", "update"], "Updating package list",
+                                           capture=False):
+        if run_command(["sudo", "apt", "install", "-y", "tesseract-ocr-hin"],
+                       "Installing Hindi language pack", capture=False):
             return True
     
     # Try yum/dnf
-    if run_command("sudo yum install -y tesseract-langpack-hin", "Installing Hindi with yum"):
+    if run_command(["sudo", "yum", "install", "-y", "tesseract-langpack-hin"],
+                   "Installing Hindi with yum", capture=False):
         return True
     
-    if run_command("sudo dnf install -y tesseract-langpack-hin", "Installing Hindi with dnf"):
+    if run_command(["sudo", "dnf", "install", "-y", "tesseract-langpack-hin"],
+                   "Installing Hindi with dnf", capture=False):
         return True
     
     # Manual installation
@@ -140,26 +228,22 @@ def install_hindi_linux():
     
     try:
         with tempfile.NamedTemporaryFile(suffix='.traineddata', delete=False) as tmp_file:
-            urllib.request.urlretrieve(hindi_url, tmp_file.name)
-            
-            # Try common tessdata locations
-            tessdata_dirs = [
-                "/usr/share/tesseract-ocr/4.00/tessdata",
-                "/usr/share/tesseract-ocr/tessdata",
-                "/usr/share/tessdata",
-                "/opt/homebrew/share/tessdata"
-            ]
+            pass
+        try:
+            download_file(hindi_url, tmp_file.name)
             
-            for tessdata_dir in tessdata_dirs:
+            # Try common tessdata locations; one root process copies and renames into place
+            for tessdata_dir in LINUX_TESSDATA_DIRS:
                 if os.path.exists(tessdata_dir):
                     target = os.path.join(tessdata_dir, "hin.traineddata")
-                    if run_command(f"sudo cp {tmp_file.name} {target}", f"Installing to {tessdata_dir}"):
-                        os.unlink(tmp_file.name)
+                    if run_command(["sudo", sys.executable, "-c", _SUDO_ATOMIC_COPY, tmp_file.name, target],
+                                   f"Installing to {tessdata_dir}"):
                         return True
-            
+        finally:
             os.unlink(tmp_file.name)
-            print_status("Could not find tessdata directory for manual installation", "error")
-            return False
+        
+        print_status("Could not find tessdata directory for manual installation", "error")
+        return False
             
     except Exception as e:
         print_status(f"Manual installation failed: {e}", "error")
@@ -169,8 +253,14 @@ def install_hindi_macos():
     """Install Hindi language pack on macOS"""
     print_status("Installing Hindi language pack for macOS...", "info")
     
+    existing = find_hindi_traineddata(MACOS_TESSDATA_DIRS)
+    if existing:
+        print_status(f"Hindi language pack already present: {existing}", "success")
+        return True
+    
     # Try homebrew
-    if run_command("brew install tesseract-lang", "Installing language packs with Homebrew"):
+    if run_command(["brew", "install", "tesseract-lang"], "Installing language packs with Homebrew",
+                   capture=False):
         return True
     
     # Manual installation
@@ -178,21 +268,16 @@ def install_hindi_macos():
     hindi_url = "https://github.com/tesseract-ocr/tessdata_best/raw/main/hin.traineddata"
     
     try:
-        tessdata_dirs = [
-            "/opt/homebrew/share/tessdata",
-            "/usr/local/share/tessdata",
-            "/usr/share/tessdata"
-        ]
-        
-        for tessdata_dir in tessdata_dirs:
+        for tessdata_dir in MACOS_TESSDATA_DIRS:
             if os.path.exists(tessdata_dir):
                 target = os.path.join(tessdata_dir, "hin.traineddata")
-                with tempfile.NamedTemporaryFile(suffix='.traineddata', delete=False) as tmp_file:
-                    urllib.request.urlretrieve(hindi_url, tmp_file.name)
-                    if run_command(f"cp {tmp_file.name} {target}", f"Installing to {tessdata_dir}"):
-                        os.unlink(tmp_file.name)
-                        return True
-                    os.unlink(tmp_file.name)
+                print_status(f"Installing to {tessdata_dir}", "info")
+                try:
+                    download_into_place(hindi_url, target)
+                    print_status(f"Success: Installing to {tessdata_dir}", "success")
+                    return True
+                except PermissionError as e:
+                    print_status(f"Failed: {e}", "error")
         
         print_status("Could not find tessdata directory", "error")
         return False
@@ -213,7 +298,8 @@ def install_easyocr():
     except ImportError:
         pass
     
-    if run_command("pip install easyocr", "Installing EasyOCR"):
+    if run_command([sys.executable, "-m", "pip", "install", "easyocr"], "Installing EasyOCR",
+                   capture=False):
         print_status("EasyOCR installed successfully!", "success")
         return True
     else:
@@ -266,10 +352,9 @@ def main():
         print_status("Hindi language pack is already installed!", "success")
     else:
         # Install based on platform
-        system = platform.system().lower()
-        if system == "windows":
+        if SYSTEM == "windows":
             success = install_hindi_windows()
-        elif system == "darwin":
+        elif SYSTEM == "darwin":
             success = install_hindi_macos()
         else:
             success = install_hindi_linux()
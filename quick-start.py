@@ -9,19 +9,33 @@ import sys
 import platform
 import subprocess
 import time
-import webbrowser
-import logging
+import shlex
+import shutil
+import socket
+import hashlib
+import glob
+from importlib.metadata import distributions
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('quickstart.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+    from packaging.utils import canonicalize_name
+    PACKAGING_SUPPORT = True
+except ImportError:
+    PACKAGING_SUPPORT = False
+
+def configure_logging():
+    """Configure logging; imported here so it's only paid for when the script actually runs"""
+    import logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('quickstart.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 class Colors:
     PURPLE = '\033[95m'
@@ -34,16 +48,130 @@ class Colors:
     WHITE = '\033[37m'
     END = '\033[0m'
 
+# Plain output when redirected, or when NO_COLOR / TERM=dumb ask for it
+if not sys.stdout.isatty() or 'NO_COLOR' in os.environ or os.environ.get('TERM') == 'dumb':
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+# Persistent download caches
+CACHE_DIR = Path('.cache')
+PIP_CACHE_DIR = CACHE_DIR / 'pip'
+NPM_CACHE_DIR = CACHE_DIR / 'npm'
+
+# Stamps recording what the venv / node_modules were last installed from, kept inside
+# them (the same files setup.py writes) so a deleted or recreated install has none
+REQUIREMENTS_STAMP = Path('backend/venv/.requirements.sha256')
+PACKAGE_LOCK_STAMP = Path('frontend/node_modules/.pkg.sha256')
+
+def fingerprint(path, *extra):
+    """SHA-256 of a file's contents plus any extra strings, or None if it is missing"""
+    try:
+        digest = hashlib.sha256(Path(path).read_bytes())
+    except OSError:
+        return None
+    for value in extra:
+        digest.update(value.encode())
+    return digest.hexdigest()
+
+def stamp_matches(stamp, digest):
+    """True if the stamp file holds digest"""
+    try:
+        return digest is not None and stamp.read_text().strip() == digest
+    except OSError:
+        return False
+
+def requirements_fingerprint():
+    """Digest of requirements.txt plus the interpreter, OS and architecture
+
+    setup.py also folds in the PyTorch packages it installs, so this stamp never
+    satisfies setup.py and it still installs them.
+    """
+    return fingerprint('backend/requirements.txt', sys.version, platform.system().lower(), platform.machine())
+
+def venv_satisfies(requirements_file, venv_dir='backend/venv'):
+    """True if every requirement is already met by the venv's installed distributions
+
+    Reads the venv's package metadata in-process instead of asking pip. Without
+    the packaging library the specifiers can't be checked, so this says no.
+    """
+    if not PACKAGING_SUPPORT:
+        return False
+    site_packages = (glob.glob(os.path.join(venv_dir, 'lib', 'python*', 'site-packages'))
+                     + glob.glob(os.path.join(venv_dir, 'Lib', 'site-packages')))
+    if not site_packages:
+        return False
+    installed = {canonicalize_name(dist.metadata['Name']): dist.version
+                 for dist in distributions(path=site_packages) if dist.metadata['Name']}
+    try:
+        with open(requirements_file) as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                requirement = Requirement(line)
+                if requirement.marker and not requirement.marker.evaluate():
+                    continue
+                version = installed.get(canonicalize_name(requirement.name))
+                if version is None or not requirement.specifier.contains(version, prereleases=True):
+                    return False
+    except (OSError, InvalidRequirement):
+        return False
+    return True
+
+IS_WINDOWS = platform.system().lower() == 'windows'
+
+# Commands run without a shell, so executables are resolved to full paths up front
+VENV_PYTHON = os.path.abspath(
+    'backend/venv/Scripts/python.exe' if IS_WINDOWS else 'backend/venv/bin/python')
+NPM = shutil.which('npm') or 'npm'
+# Windows servers get their own console window; a no-op elsewhere
+NEW_CONSOLE = getattr(subprocess, 'CREATE_NEW_CONSOLE', 0)
+# cmd /k keeps that window open after the server exits, so a crash's traceback stays readable
+KEEP_CONSOLE_OPEN = ['cmd', '/k'] if IS_WINDOWS else []
+
+BACKEND_PORT = 5000
+FRONTEND_PORT = 3000
+SERVER_PORTS = {BACKEND_PORT: 'Backend', FRONTEND_PORT: 'Frontend'}
+SERVER_START_TIMEOUT = 60.0
+PORT_PROBE_TIMEOUT = 0.2
+
+def port_up(port):
+    """True if something accepts connections on 127.0.0.1:port"""
+    # A literal address skips resolving "localhost", which may try ::1 first
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=PORT_PROBE_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+def wait_ready(ports, timeout=SERVER_START_TIMEOUT, interval=0.1):
+    """Poll all ports under one deadline, backing off up to 0.25s; returns the ports still down"""
+    pending = set(ports)
+    deadline = time.monotonic() + timeout
+    while True:
+        pending = {port for port in pending if not port_up(port)}
+        if not pending or time.monotonic() >= deadline:
+            return pending
+        time.sleep(interval)
+        interval = min(interval * 1.25, 0.25)
+
 def run_command(cmd, cwd=None):
-    """Run a command and handle errors"""
+    """Run an argument list (or a plain string, split without a shell) and handle errors
+
+    Output is streamed line by line as it arrives, prefixed with the working
+    directory so concurrent backend and frontend installs stay readable.
+    """
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd, posix=not IS_WINDOWS)
+    prefix = f"[{cwd}] " if cwd else ""
     try:
-        if platform.system().lower() == 'windows':
-            result = subprocess.run(cmd, shell=True, cwd=cwd, text=True, capture_output=True)
-        else:
-            result = subprocess.run(cmd, shell=True, cwd=cwd, text=True, capture_output=True)
+        with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              bufsize=1, text=True, errors='replace') as proc:
+            for line in proc.stdout:
+                sys.stdout.write(prefix + line)
         
-        if result.returncode != 0:
-            print(f"{Colors.RED}Command failed with error: {result.stderr}{Colors.END}")
+        if proc.returncode != 0:
+            print(f"{Colors.RED}Command failed with exit code {proc.returncode}{Colors.END}")
             return False
         return True
     except Exception as e:
@@ -54,31 +182,57 @@ def setup_backend():
     """Set up the backend environment"""
     print(f"{Colors.BLUE}Setting up backend...{Colors.END}")
     
+    digest = requirements_fingerprint()
+    if os.path.exists('backend/venv'):
+        if stamp_matches(REQUIREMENTS_STAMP, digest):
+            print(f"{Colors.WHITE}Python dependencies are up to date{Colors.END}")
+            return True
+        # No matching stamp (first run, or requirements edited): check what the venv has
+        if venv_satisfies('backend/requirements.txt'):
+            if digest:
+                REQUIREMENTS_STAMP.write_text(digest)
+            print(f"{Colors.WHITE}Python dependencies are already installed{Colors.END}")
+            return True
+    
     # Create and activate virtual environment
     if not os.path.exists('backend/venv'):
         print(f"{Colors.WHITE}Creating virtual environment...{Colors.END}")
-        if not run_command('python -m venv venv', cwd='backend'):
-            return False
+        try:
+            # Built in-process: no extra interpreter just to import the venv module
+            import venv
+            venv.EnvBuilder(with_pip=True, symlinks=not IS_WINDOWS).create(os.path.abspath('backend/venv'))
+        except Exception as e:
+            print(f"{Colors.YELLOW}In-process venv creation failed ({e}), retrying with python -m venv...{Colors.END}")
+            if not run_command([sys.executable, '-m', 'venv', 'venv'], cwd='backend'):
+                return False
     
     # Install dependencies using the full path to pip
     print(f"{Colors.WHITE}Installing Python dependencies...{Colors.END}")
-    if platform.system().lower() == 'windows':
-        if not run_command('.\\venv\\Scripts\\python.exe -m pip install -r requirements.txt', cwd='backend'):
-            return False
-    else:
-        if not run_command('./venv/bin/pip install -r requirements.txt', cwd='backend'):
-            return False
+    if not run_command([VENV_PYTHON, '-m', 'pip', 'install', '--cache-dir', str(PIP_CACHE_DIR.resolve()),
+                        '--prefer-binary', '--no-compile', '-r', 'requirements.txt'], cwd='backend'):
+        return False
     
+    if digest:
+        REQUIREMENTS_STAMP.write_text(digest)
     return True
 
 def setup_frontend():
     """Set up the frontend environment"""
     print(f"{Colors.BLUE}Setting up frontend...{Colors.END}")
     
+    if stamp_matches(PACKAGE_LOCK_STAMP, fingerprint('frontend/package-lock.json')):
+        print(f"{Colors.WHITE}Node.js dependencies are up to date{Colors.END}")
+        return True
+    
     print(f"{Colors.WHITE}Installing Node.js dependencies...{Colors.END}")
-    if not run_command('npm install --yes', cwd='frontend'):
+    if not run_command([NPM, 'install', '--yes', '--prefer-offline', '--no-audit', '--no-fund',
+                        '--cache', str(NPM_CACHE_DIR.resolve())], cwd='frontend'):
         return False
     
+    # npm install may rewrite the lockfile, so stamp what it left behind
+    digest = fingerprint('frontend/package-lock.json')
+    if digest:
+        PACKAGE_LOCK_STAMP.write_text(digest)
     return True
 
 def start_servers():
@@ -87,83 +241,103 @@ def start_servers():
     
     # Start backend server in a separate process
     print(f"{Colors.WHITE}Starting backend server...{Colors.END}")
-    if platform.system().lower() == 'windows':
-        backend_cmd = '.\\venv\\Scripts\\python.exe run_backend.py'
-        # Start in a new command prompt window
-        backend_process = subprocess.Popen(
-            f'start "OCR Backend Server" cmd /k "cd /d {os.path.abspath("backend")} && {backend_cmd}"',
-            shell=True,
-            cwd='backend'
-        )
-    else:
-        backend_cmd = './venv/bin/python run_backend.py'
-        backend_process = subprocess.Popen(
-            backend_cmd,
-            shell=True,
-            cwd='backend'
-        )
-    
-    # Give backend server time to start
-    print(f"{Colors.WHITE}Waiting for backend server to start...{Colors.END}")
-    time.sleep(5)
+    backend_process = subprocess.Popen(
+        KEEP_CONSOLE_OPEN + [VENV_PYTHON, 'run_backend.py'],
+        cwd='backend',
+        # One interpreter instead of reloader parent + child: the OCR stack is imported once
+        env={**os.environ, 'BACKEND_RELOAD': 'false'},
+        creationflags=NEW_CONSOLE
+    )
     
     # Start frontend server in a separate process
     print(f"{Colors.WHITE}Starting frontend server...{Colors.END}")
-    if platform.system().lower() == 'windows':
-        # Start in a new command prompt window
-        frontend_process = subprocess.Popen(
-            f'start "OCR Frontend Server" cmd /k "cd /d {os.path.abspath("frontend")} && npm run dev"',
-            shell=True,
-            cwd='frontend'
-        )
-    else:
-        frontend_process = subprocess.Popen(
-            'npm run dev',
-            shell=True,
-            cwd='frontend'
-        )
-    
-    # Give frontend server time to start
-    print(f"{Colors.WHITE}Waiting for frontend server to start...{Colors.END}")
-    time.sleep(3)
+    frontend_process = subprocess.Popen(
+        KEEP_CONSOLE_OPEN + [NPM, 'run', 'dev'],
+        cwd='frontend',
+        creationflags=NEW_CONSOLE
+    )
+    
+    # Both boot in parallel; return as soon as each one is listening
+    print(f"{Colors.WHITE}Waiting for servers to start...{Colors.END}")
+    for port in sorted(wait_ready(SERVER_PORTS)):
+        print(f"{Colors.YELLOW}[!] {SERVER_PORTS[port]} is not answering on port {port} yet{Colors.END}")
     
     return True
 
+def _block(*lines):
+    """Pre-color (color, text) lines into one output block; color None is plain text"""
+    return "".join(f"{color}{text}{Colors.END}\n" if color else f"{text}\n" for color, text in lines)
+
+_BOX_WIDTH = 68
+
+BANNER = (
+    f"{Colors.PURPLE}{Colors.BOLD}\n"
+    + "╔" + "═" * _BOX_WIDTH + "╗\n"
+    + "║" + " " * _BOX_WIDTH + "║\n"
+    + "║" + "  >> OCR LEGAL DOCUMENT PROCESSOR - QUICK START <<  ".center(_BOX_WIDTH) + "║\n"
+    + "║" + " " * _BOX_WIDTH + "║\n"
+    + "║" + "  AI-powered document processing for ALL devices! 📱💻  ".center(_BOX_WIDTH) + "║\n"
+    + "║" + " " * _BOX_WIDTH + "║\n"
+    + "╚" + "═" * _BOX_WIDTH + "╝\n"
+    + f"{Colors.END}\n\n"
+    + _block(
+        (Colors.GREEN, "🎉 NOW WITH FULL MOBILE SUPPORT! 📱"),
+        (Colors.CYAN, "  ✨ Fully responsive design for phones, tablets & desktop"),
+        (Colors.CYAN, "  🚀 Progressive Web App (PWA) - install like a native app"),
+        (Colors.CYAN, "  ⚡ Touch-optimized interface with offline capability"),
+        (None, ""),
+        (Colors.WHITE, "This script will:"),
+        (Colors.CYAN, "  [+] Check all system requirements"),
+        (Colors.CYAN, "  [+] Install dependencies automatically"),
+        (Colors.CYAN, "  [+] Set up PWA and mobile features"),
+        (Colors.CYAN, "  [+] Start both servers"),
+        (Colors.CYAN, "  [+] Open the application in your browser"),
+        (None, ""),
+    )
+)
+
+SUCCESS_MESSAGE = _block(
+    (Colors.GREEN, "[+] Setup complete! The application is now running."),
+    (Colors.WHITE, "Frontend: http://localhost:3000"),
+    (Colors.WHITE, "Backend: http://localhost:5000"),
+    (None, ""),
+    (Colors.GREEN, "📱 MOBILE ACCESS:"),
+    (Colors.CYAN, "  • Desktop: http://localhost:3000"),
+    (Colors.CYAN, "  • Mobile: http://[your-ip]:3000 (find your IP in network settings)"),
+    (Colors.CYAN, "  • PWA: Use 'Add to Home Screen' for native app experience"),
+    (None, ""),
+    (Colors.YELLOW, "[!] Two new command prompt windows have been opened for the servers."),
+    (Colors.YELLOW, "[!] To stop the application, close both server windows."),
+    (None, ""),
+    (Colors.WHITE, "Opening application in your browser..."),
+)
+
 def print_banner():
     """Print welcome banner"""
-    print(f"{Colors.PURPLE}{Colors.BOLD}")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 68 + "║")
-    print("║" + "  >> OCR LEGAL DOCUMENT PROCESSOR - QUICK START <<  ".center(68) + "║")
-    print("║" + " " * 68 + "║")
-    print("║" + "  AI-powered document processing for ALL devices! 📱💻  ".center(68) + "║")
-    print("║" + " " * 68 + "║")
-    print("╚" + "═" * 68 + "╝")
-    print(f"{Colors.END}\n")
-    
-    print(f"{Colors.GREEN}🎉 NOW WITH FULL MOBILE SUPPORT! 📱{Colors.END}")
-    print(f"{Colors.CYAN}  ✨ Fully responsive design for phones, tablets & desktop{Colors.END}")
-    print(f"{Colors.CYAN}  🚀 Progressive Web App (PWA) - install like a native app{Colors.END}")
-    print(f"{Colors.CYAN}  ⚡ Touch-optimized interface with offline capability{Colors.END}")
-    print()
-    
-    print(f"{Colors.WHITE}This script will:{Colors.END}")
-    print(f"{Colors.CYAN}  [+] Check all system requirements{Colors.END}")
-    print(f"{Colors.CYAN}  [+] Install dependencies automatically{Colors.END}")
-    print(f"{Colors.CYAN}  [+] Set up PWA and mobile features{Colors.END}")
-    print(f"{Colors.CYAN}  [+] Start both servers{Colors.END}")
-    print(f"{Colors.CYAN}  [+] Open the application in your browser{Colors.END}")
-    print()
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+
+def print_success_message():
+    """Print where the running application can be reached"""
+    sys.stdout.write(SUCCESS_MESSAGE)
+    sys.stdout.flush()
 
 def main():
     """Main entry point"""
+    configure_logging()
     print_banner()
     
-    if not setup_backend():
+    # pip and npm are network-bound and independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        frontend = pool.submit(setup_frontend)
+        backend_ok = setup_backend()
+        frontend_ok = frontend.result()
+    
+    if not backend_ok:
         print(f"{Colors.RED}[X] Backend setup failed{Colors.END}")
         sys.exit(1)
     
-    if not setup_frontend():
+    if not frontend_ok:
         print(f"{Colors.RED}[X] Frontend setup failed{Colors.END}")
         sys.exit(1)
     
@@ -171,23 +345,11 @@ def main():
         print(f"{Colors.RED}[X] Failed to start servers{Colors.END}")
         sys.exit(1)
     
-    print(f"{Colors.GREEN}[+] Setup complete! The application is now running.{Colors.END}")
-    print(f"{Colors.WHITE}Frontend: http://localhost:3000{Colors.END}")
-    print(f"{Colors.WHITE}Backend: http://localhost:5000{Colors.END}")
-    print()
-    print(f"{Colors.GREEN}📱 MOBILE ACCESS:{Colors.END}")
-    print(f"{Colors.CYAN}  • Desktop: http://localhost:3000{Colors.END}")
-    print(f"{Colors.CYAN}  • Mobile: http://[your-ip]:3000 (find your IP in network settings){Colors.END}")
-    print(f"{Colors.CYAN}  • PWA: Use 'Add to Home Screen' for native app experience{Colors.END}")
-    print()
-    print(f"{Colors.YELLOW}[!] Two new command prompt windows have been opened for the servers.{Colors.END}")
-    print(f"{Colors.YELLOW}[!] To stop the application, close both server windows.{Colors.END}")
-    print()
-    print(f"{Colors.WHITE}Opening application in your browser...{Colors.END}")
-    
-    # Wait a bit more for servers to fully start, then open browser
-    time.sleep(5)
+    print_success_message()
+    
+    # start_servers already waited for the frontend port, so the page is servable
     try:
+        import webbrowser
         webbrowser.open('http://localhost:3000')
     except:
         print(f"{Colors.YELLOW}[!] Could not open browser automatically. Please visit: http://localhost:3000{Colors.END}")
@@ -7,10 +7,22 @@ This script downloads and sets up Poppler binaries for PDF processing
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
-import tempfile
+import time
 from pathlib import Path
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 30
+
+# One session for every request: redirects and retries reuse its pooled TLS connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5,
+                                                        status_forcelist=[502, 503, 504])))
+# Minimum seconds between progress redraws; a console write per chunk slows Windows terminals
+PROGRESS_INTERVAL = 0.1
+
 def download_poppler_windows():
     """Download and setup Poppler for Windows"""
     
@@ -28,46 +40,65 @@ def download_poppler_windows():
     poppler_url = "https://github.com/oschwartz10612/poppler-windows/releases/download/v23.11.0-0/Release-23.11.0-0.zip"
     
     try:
-        print("Downloading Poppler binaries...")
-        response = requests.get(poppler_url, stream=True)
-        response.raise_for_status()
+        # Bytes from an interrupted run are kept on disk and resumed with a Range request
+        partial_path = project_root / "poppler-download.zip.partial"
+        resume_from = partial_path.stat().st_size if partial_path.exists() else 0
+        headers = {'Range': f'bytes={resume_from}-'} if resume_from else {}
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+        print("Resuming Poppler download..." if resume_from else "Downloading Poppler binaries...")
+        response = SESSION.get(poppler_url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT)
+        
+        # 416: the partial file already holds the whole archive
+        if response.status_code != 416:
+            response.raise_for_status()
             
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    tmp_file.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\rProgress: {percent:.1f}%", end='', flush=True)
+            # 206 continues the partial file; a plain 200 means the server ignored Range
+            resuming = response.status_code == 206
+            downloaded = resume_from if resuming else 0
+            total_size = int(response.headers.get('content-length', 0))
+            if total_size > 0:
+                total_size += downloaded
+            last_progress = 0.0
             
-            print("\n✓ Download completed")
+            with open(partial_path, 'ab' if resuming else 'wb') as partial_file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        partial_file.write(chunk)
+                        downloaded += len(chunk)
+                        now = time.monotonic()
+                        if total_size > 0 and now - last_progress >= PROGRESS_INTERVAL:
+                            last_progress = now
+                            sys.stdout.write(f"\rProgress: {downloaded * 100 / total_size:.1f}%")
+                            sys.stdout.flush()
             
-            # Extract the zip file
-            print("Extracting Poppler...")
-            with zipfile.ZipFile(tmp_file.name, 'r') as zip_ref:
+            if total_size > 0:
+                sys.stdout.write("\rProgress: 100.0%")
+        print("\n✓ Download completed")
+        
+        # Extract the zip file
+        print("Extracting Poppler...")
+        try:
+            with zipfile.ZipFile(partial_path, 'r') as zip_ref:
                 zip_ref.extractall(poppler_dir)
-            
-            print(f"✓ Poppler extracted to {poppler_dir}")
-            
-            # Clean up
-            os.unlink(tmp_file.name)
-            
-            # Return the bin path
-            bin_path = poppler_dir / "poppler-23.11.0" / "Library" / "bin"
+        except zipfile.BadZipFile:
+            # Unusable bytes must not be resumed from next time
+            partial_path.unlink()
+            raise
+        partial_path.unlink()
+        
+        print(f"✓ Poppler extracted to {poppler_dir}")
+        
+        # Return the bin path
+        bin_path = poppler_dir / "poppler-23.11.0" / "Library" / "bin"
+        if not bin_path.exists():
+            # Try alternative structure
+            bin_path = poppler_dir / "Library" / "bin"
             if not bin_path.exists():
-                # Try alternative structure
-                bin_path = poppler_dir / "Library" / "bin"
-                if not bin_path.exists():
-                    print("Warning: Could not find Poppler bin directory")
-                    return None
-            
-            print(f"✓ Poppler setup complete: {bin_path}")
-            return str(bin_path)
+                print("Warning: Could not find Poppler bin directory")
+                return None
+        
+        print(f"✓ Poppler setup complete: {bin_path}")
+        return str(bin_path)
             
     except Exception as e:
         print(f"Error downloading Poppler: {e}")
@@ -103,8 +134,9 @@ def test_poppler():
     import subprocess
     
     try:
+        # Only the exit status matters, so the help text goes straight to DEVNULL
         result = subprocess.run(['pdftoppm', '-h'], 
-                              capture_output=True, timeout=5)
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
         if result.returncode == 0:
             print("✓ Poppler is working correctly!")
             return True
@@ -9,9 +9,13 @@ import sys
 import subprocess
 import platform
 import shutil
-import urllib.request
 import json
+import hashlib
+import io
+import functools
+import collections
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -25,20 +29,240 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Plain output when redirected, or when NO_COLOR / TERM=dumb ask for it
+if not sys.stdout.isatty() or 'NO_COLOR' in os.environ or os.environ.get('TERM') == 'dumb':
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+# Fixed for the life of the process
+SYSTEM = platform.system().lower()
+IS_WINDOWS = SYSTEM == 'windows'
+
+# Tool probe results, reused while the probed binary's mtime and size are unchanged
+PROBE_CACHE = Path('.cache') / 'prereqs.json'
+# Project-local pip cache, shared with quick-start.py, so re-setups reuse downloaded wheels
+PIP_CACHE_DIR = Path('.cache') / 'pip'
+# Lines of backend import-test output kept for the failure report
+IMPORT_TEST_TAIL_LINES = 200
+PROBE_COMMANDS = [['node', '--version'], ['tesseract', '--version']]
+# Seconds a single --version probe may take before the tool is treated as unusable
+PROBE_TIMEOUT = 5
+
+# Per-platform install instructions shown when a tool is missing
+TESSERACT_INSTALL_HINTS = {
+    'windows': 'Download from: https://github.com/UB-Mannheim/tesseract/wiki',
+    'darwin': 'Run: brew install tesseract',
+    'linux': 'Run: sudo apt install tesseract-ocr'
+}
+POPPLER_INSTALL_HINTS = {
+    'windows': 'Download from: https://github.com/oschwartz10612/poppler-windows/releases',
+    'darwin': 'Run: brew install poppler',
+    'linux': 'Run: sudo apt install poppler-utils'
+}
+
+# Stamps recording what the venv / node_modules were last installed from
+REQUIREMENTS_STAMP = '.requirements.sha256'
+PACKAGE_LOCK_STAMP = '.pkg.sha256'
+
+# Installed alongside requirements.txt for local NLP; not part of the requirements file
+LOCAL_NLP_PACKAGES = ['torch', 'torchvision', 'torchaudio']
+
+def fingerprint(path, *extra):
+    """SHA-256 of a file's contents plus any extra strings, or None if it is missing"""
+    try:
+        digest = hashlib.sha256(Path(path).read_bytes())
+    except OSError:
+        return None
+    for value in extra:
+        digest.update(value.encode())
+    return digest.hexdigest()
+
+def stamp_matches(stamp, digest):
+    """True if the stamp file holds digest"""
+    try:
+        return digest is not None and stamp.read_text().strip() == digest
+    except OSError:
+        return False
+
+HEADER = (
+    "\n" + "=" * 60 + "\n"
+    "  OCR LEGAL DOCUMENT PROCESSOR - AUTOMATED SETUP\n"
+    + "=" * 60 + "\n"
+    "\nThis script will automatically set up everything you need!\n\n"
+)
+
+@functools.lru_cache(maxsize=None)
+def resolve_tool(name):
+    """Full path of an executable on PATH (or None), looked up once per run"""
+    return shutil.which(name)
+
+def atomic_write(path, data):
+    """Write bytes next to path and rename it over path, so a crash never leaves half a file"""
+    tmp = f"{path}.tmp"
+    Path(tmp).write_bytes(data)
+    os.replace(tmp, path)
+
+# Starts the Flask backend and the React frontend for development
+DEV_SCRIPT_SH = """
+#!/bin/bash
+# This script starts both the Flask backend and the React frontend for development.
+
+# Function to kill all child processes
+cleanup() {
+    echo "Shutting down servers..."
+    kill 0
+}
+trap cleanup EXIT
+
+# Start backend
+echo "Starting Flask backend..."
+source backend/venv/bin/activate
+flask --app backend/app run &
+BACKEND_PID=$!
+
+# Start frontend
+echo "Starting React frontend..."
+cd frontend
+npm run dev &
+FRONTEND_PID=$!
+
+# Wait for both processes to complete
+wait $BACKEND_PID
+wait $FRONTEND_PID
+"""
+
+DEV_SCRIPT_BAT = """
+@echo off
+ECHO.
+ECHO ========================================================
+ECHO  Starting OCR Legal Document Processor
+ECHO ========================================================
+ECHO.
+ECHO This will open two new command prompt windows:
+ECHO   1. Flask Backend Server
+ECHO   2. React Frontend Server
+ECHO.
+ECHO To stop the application, simply close both of those new windows.
+ECHO.
+
+REM Start backend in a new window and keep it open
+ECHO Starting Flask backend...
+start "Flask Backend" cmd /k "cd backend && .\\venv\\Scripts\\activate && flask run"
+
+REM Start frontend in a new window and keep it open
+ECHO Starting React frontend...
+start "React Frontend" cmd /k "cd frontend && npm run dev"
+
+ECHO.
+ECHO Servers are starting up in new windows...
+"""
+
+# Fallback .env when env.example is missing
+ENV_TEMPLATE = b"""# OCR Legal Document Processor Configuration
+
+# NLP Model Configuration
+# Set to 'true' for local models (free, private, offline)
+# Set to 'false' for Google Gemini API (requires API key and billing)
+USE_LOCAL_NLP=true
+
+# Optional: Google Gemini API Key (only needed if USE_LOCAL_NLP=false)
+# Get your key from: https://aistudio.google.com/app/apikey
+# GEMINI_API_KEY=your_actual_api_key_here
+
+# Flask Configuration
+FLASK_ENV=development
+FLASK_DEBUG=True
+
+# Performance Settings
+MAX_CONTENT_LENGTH=16777216
+ALLOWED_EXTENSIONS=png,jpg,jpeg,gif,bmp,tiff,pdf
+"""
+
+# Encoded once; the .bat gets explicit CRLF line endings
+DEV_SCRIPT_SH_BYTES = DEV_SCRIPT_SH.encode()
+DEV_SCRIPT_BAT_BYTES = DEV_SCRIPT_BAT.replace('\n', '\r\n').encode()
+
+# Fixed parts of the setup summary, colored once at import
+SUMMARY_HEADER = (
+    f"\n{Colors.CYAN}{Colors.BOLD}\n"
+    + "=" * 60 + "\n"
+    "  SETUP SUMMARY\n"
+    + "=" * 60 + "\n"
+    f"{Colors.END}\n"
+    "\n+ SUCCESSFUL STEPS:\n"
+)
+WARNINGS_HEADING = f"\n{Colors.YELLOW}! WARNINGS:{Colors.END}\n"
+ERRORS_HEADING = f"\n{Colors.RED}X ERRORS:{Colors.END}\n"
+ERRORS_FOOTER = f"\n{Colors.RED}Please fix the errors above before proceeding.{Colors.END}\n"
+_SUCCESS_LEAD = (
+    f"\n{Colors.GREEN}{Colors.BOLD}🎉 Setup complete!{Colors.END}\n"
+    "To start the application, run:\n"
+)
+SUCCESS_FOOTER = _SUCCESS_LEAD + "   ./start-dev.sh\n"
+SUCCESS_FOOTER_WINDOWS = _SUCCESS_LEAD + "   start-dev.bat\n"
+
 class SetupManager:
     def __init__(self):
-        self.system = platform.system().lower()
+        self.system = SYSTEM
         self.errors = []
         self.warnings = []
         self.success_steps = []
-        self.is_windows = self.system == 'windows'
+        self.is_windows = IS_WINDOWS
+        self.probe_cache = self.load_probe_cache()
+        self.probe_cache_dirty = False
         
+    def load_probe_cache(self):
+        """Load probe results saved by a previous run"""
+        try:
+            return json.loads(PROBE_CACHE.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def save_probe_cache(self):
+        """Atomically write probe results if any were refreshed"""
+        if not self.probe_cache_dirty:
+            return
+        try:
+            PROBE_CACHE.parent.mkdir(exist_ok=True)
+            tmp = PROBE_CACHE.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self.probe_cache, indent=2))
+            os.replace(tmp, PROBE_CACHE)
+        except OSError:
+            pass
+
+    def run_probe(self, command):
+        """Run a tool probe, reusing the cached output while the binary is unchanged"""
+        path = resolve_tool(command[0])
+        if path is None:
+            raise FileNotFoundError(command[0])
+        st = os.stat(path)
+        key = ' '.join(command)
+        stamp = [path, st.st_mtime_ns, st.st_size]
+        cached = self.probe_cache.get(key)
+        if cached and cached['stamp'] == stamp:
+            return subprocess.CompletedProcess(command, cached['returncode'], cached['stdout'], cached['stderr'])
+        
+        # which() resolved the full path (node.cmd etc. on Windows), so no shell is needed
+        result = subprocess.run([path] + command[1:], capture_output=True, text=True, timeout=PROBE_TIMEOUT)
+        self.probe_cache[key] = {'stamp': stamp, 'returncode': result.returncode,
+                                 'stdout': result.stdout, 'stderr': result.stderr}
+        self.probe_cache_dirty = True
+        return result
+
+    def prefetch_probes(self):
+        """Run all tool probes concurrently so the checks below only read the cache"""
+        def probe(command):
+            try:
+                self.run_probe(command)
+            except (OSError, subprocess.SubprocessError):
+                pass
+        with ThreadPoolExecutor(max_workers=len(PROBE_COMMANDS)) as pool:
+            list(pool.map(probe, PROBE_COMMANDS))
+
     def print_header(self):
         """Print welcome header"""
-        print("\n" + "=" * 60)
-        print("  OCR LEGAL DOCUMENT PROCESSOR - AUTOMATED SETUP")
-        print("=" * 60)
-        print("\nThis script will automatically set up everything you need!\n")
+        sys.stdout.write(HEADER)
+        sys.stdout.flush()
 
     def check_python_version(self):
         """Check if Python version is compatible"""
@@ -58,13 +282,13 @@ class SetupManager:
         print(">> Checking Node.js...")
         
         try:
-            # Use shell=True for better compatibility on Windows
-            result = subprocess.run(['node', '--version'], capture_output=True, text=True, check=True, shell=self.is_windows)
+            result = self.run_probe(['node', '--version'])
+            result.check_returncode()
             version = result.stdout.strip()
             print(f"   + Node.js {version} detected")
             self.success_steps.append("Node.js check")
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.SubprocessError, FileNotFoundError):
             self.errors.append("Node.js is not installed. Please install Node.js 16+ from https://nodejs.org/")
             return False
 
@@ -73,42 +297,27 @@ class SetupManager:
         print(">> Checking Tesseract OCR...")
         
         try:
-            # Use shell=True for better compatibility on Windows
-            result = subprocess.run(['tesseract', '--version'], capture_output=True, text=True, check=True, shell=self.is_windows)
+            result = self.run_probe(['tesseract', '--version'])
+            result.check_returncode()
             version_line = result.stdout.split('\n')[0]
             print(f"   + {version_line}")
             self.success_steps.append("Tesseract OCR check")
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            install_cmd = {
-                'windows': 'Download from: https://github.com/UB-Mannheim/tesseract/wiki',
-                'darwin': 'Run: brew install tesseract',
-                'linux': 'Run: sudo apt install tesseract-ocr'
-            }
-            self.errors.append(f"Tesseract OCR not found. {install_cmd.get(self.system, 'Please install Tesseract OCR')}")
+        except (subprocess.SubprocessError, FileNotFoundError):
+            self.errors.append(f"Tesseract OCR not found. {TESSERACT_INSTALL_HINTS.get(self.system, 'Please install Tesseract OCR')}")
             return False
 
     def check_poppler(self):
         """Check if Poppler is installed (for PDF processing)"""
         print(">> Checking Poppler (PDF support)...")
         
-        try:
-            # Use shell=True for better compatibility on Windows
-            result = subprocess.run(['pdftoppm', '-h'], capture_output=True, text=True, shell=self.is_windows)
-            # Some versions of pdftoppm return non-zero on -h, so check stderr as well
-            if result.returncode == 0 or 'pdftoppm' in result.stderr:
-                print("   + Poppler utilities detected")
-                self.success_steps.append("Poppler check")
-                return True
-        except FileNotFoundError:
-            pass
+        # Only presence matters here (no version is reported), so skip running the binary
+        if resolve_tool('pdftoppm'):
+            print("   + Poppler utilities detected")
+            self.success_steps.append("Poppler check")
+            return True
 
-        install_cmd = {
-            'windows': 'Download from: https://github.com/oschwartz10612/poppler-windows/releases',
-            'darwin': 'Run: brew install poppler',
-            'linux': 'Run: sudo apt install poppler-utils'
-        }
-        self.warnings.append(f"Poppler not found (PDF processing may fail). {install_cmd.get(self.system, 'Please install Poppler')}")
+        self.warnings.append(f"Poppler not found (PDF processing may fail). {POPPLER_INSTALL_HINTS.get(self.system, 'Please install Poppler')}")
         return False
 
     def create_env_file(self):
@@ -120,34 +329,15 @@ class SetupManager:
             return True
         
         if os.path.exists('env.example'):
-            shutil.copy('env.example', '.env')
+            # Tiny template: one read and one write, no chunked copy or mode/stat copying
+            Path('.env').write_bytes(Path('env.example').read_bytes())
             print("   + Created .env file from template")
             print("   ! You can edit .env to add your Gemini API key (optional)")
             self.success_steps.append("Environment file creation")
             return True
         else:
             # Create a basic .env file
-            env_content = """# OCR Legal Document Processor Configuration
-
-# NLP Model Configuration
-# Set to 'true' for local models (free, private, offline)
-# Set to 'false' for Google Gemini API (requires API key and billing)
-USE_LOCAL_NLP=true
-
-# Optional: Google Gemini API Key (only needed if USE_LOCAL_NLP=false)
-# Get your key from: https://aistudio.google.com/app/apikey
-# GEMINI_API_KEY=your_actual_api_key_here
-
-# Flask Configuration
-FLASK_ENV=development
-FLASK_DEBUG=True
-
-# Performance Settings
-MAX_CONTENT_LENGTH=16777216
-ALLOWED_EXTENSIONS=png,jpg,jpeg,gif,bmp,tiff,pdf
-"""
-            with open('.env', 'w') as f:
-                f.write(env_content)
+            atomic_write('.env', ENV_TEMPLATE)
             print("   + Created basic .env file")
             self.success_steps.append("Environment file creation")
             return True
@@ -157,38 +347,58 @@ ALLOWED_EXTENSIONS=png,jpg,jpeg,gif,bmp,tiff,pdf
         print(">> Setting up Python backend...")
         
         backend_dir = Path('backend')
-        if not backend_dir.exists():
+        if not os.path.isdir(backend_dir):
             self.errors.append("Backend directory not found!")
             return False
         
         venv_dir = backend_dir / 'venv'
         
         # Create virtual environment
-        if not venv_dir.exists():
+        if not os.path.isdir(venv_dir):
             print("   - Creating Python virtual environment...")
             try:
-                subprocess.run([sys.executable, '-m', 'venv', str(venv_dir)], check=True)
+                # Built in-process: no extra interpreter just to import the venv module
+                import venv
+                venv.EnvBuilder(with_pip=True, symlinks=not self.is_windows).create(str(venv_dir.resolve()))
                 print("   + Virtual environment created")
-            except subprocess.CalledProcessError:
-                self.errors.append("Failed to create virtual environment")
-                return False
+            except Exception:
+                try:
+                    subprocess.run([sys.executable, '-m', 'venv', str(venv_dir)], check=True)
+                    print("   + Virtual environment created")
+                except subprocess.CalledProcessError:
+                    self.errors.append("Failed to create virtual environment")
+                    return False
         
         # Determine activation script
-        pip_path = venv_dir / 'Scripts' / 'pip' if self.is_windows else venv_dir / 'bin' / 'pip'
+        pip_path = (venv_dir / 'Scripts' / 'pip.exe' if self.is_windows else venv_dir / 'bin' / 'pip').absolute()
+        # A path with a directory, inherited stdio, no cwd/env and close_fds=False lets
+        # CPython launch pip through posix_spawn (vfork-based in glibc) instead of fork+exec
+        spawn_options = {'close_fds': False} if os.name == 'posix' else {}
         
         # Install requirements
         requirements_file = backend_dir / 'requirements.txt'
-        if requirements_file.exists():
-            print("   - Installing Python dependencies...")
+        stamp = venv_dir / REQUIREMENTS_STAMP
+        # Interpreter build, OS and architecture decide wheel compatibility; unlike
+        # platform.platform() this ignores kernel updates and skips the libc scan of the executable.
+        # The extra packages are part of it, so a stamp from quick-start.py (requirements only) won't match.
+        digest = fingerprint(requirements_file, sys.version, SYSTEM, platform.machine(),
+                             ' '.join(LOCAL_NLP_PACKAGES))
+        if stamp_matches(stamp, digest):
+            print("   + Python dependencies up to date")
+            self.success_steps.append("Backend setup")
+            return True
+        
+        if os.path.isfile(requirements_file):
+            # PyTorch (for local NLP) goes in the same pip run: one startup, one resolve
+            print("   - Installing Python dependencies and PyTorch for local NLP...")
             try:
-                subprocess.run([str(pip_path), 'install', '-r', str(requirements_file)], check=True, shell=self.is_windows)
-                print("   + Python dependencies installed")
-                
-                # Install PyTorch for local NLP
-                print("   - Installing PyTorch for local NLP...")
-                subprocess.run([str(pip_path), 'install', 'torch', 'torchvision', 'torchaudio'], check=True, shell=self.is_windows)
-                print("   + PyTorch installed")
+                subprocess.run([str(pip_path), 'install', '--no-input', '--disable-pip-version-check',
+                                '--prefer-binary', '--cache-dir', str(PIP_CACHE_DIR.resolve()),
+                                '-r', str(requirements_file)] + LOCAL_NLP_PACKAGES,
+                               check=True, **spawn_options)
+                print("   + Python dependencies and PyTorch installed")
                 
+                stamp.write_text(digest)
                 self.success_steps.append("Backend setup")
                 return True
             except subprocess.CalledProcessError as e:
@@ -203,21 +413,40 @@ ALLOWED_EXTENSIONS=png,jpg,jpeg,gif,bmp,tiff,pdf
         print(">> Setting up React frontend...")
         
         frontend_dir = Path('frontend')
-        if not frontend_dir.exists():
+        if not os.path.isdir(frontend_dir):
             self.errors.append("Frontend directory not found!")
             return False
         
         package_json = frontend_dir / 'package.json'
-        if not package_json.exists():
+        if not os.path.isfile(package_json):
             self.errors.append("package.json not found in frontend directory")
             return False
         
+        package_lock = frontend_dir / 'package-lock.json'
+        stamp = frontend_dir / 'node_modules' / PACKAGE_LOCK_STAMP
+        if stamp_matches(stamp, fingerprint(package_lock)):
+            print("   + Node.js dependencies up to date")
+            self.success_steps.append("Frontend setup")
+            return True
+        
         # Install npm dependencies
         print("   - Installing Node.js dependencies...")
         try:
-            # Use shell=True for Windows compatibility
-            subprocess.run(['npm', 'install'], cwd=frontend_dir, check=True, shell=self.is_windows)
+            # Resolve npm.cmd on Windows up front instead of routing through cmd.exe
+            npm = resolve_tool('npm') or 'npm'
+            npm_flags = ['--prefer-offline', '--no-audit', '--no-fund']
+            # On a fresh checkout npm ci installs straight from the lockfile without re-resolving
+            # the tree. It wipes node_modules first, so an existing install is updated in place
+            # with npm install instead, as is a lockfile ci rejects as out of sync.
+            fresh_install = not os.path.isdir(frontend_dir / 'node_modules')
+            if not (fresh_install and os.path.isfile(package_lock)
+                    and subprocess.run([npm, 'ci'] + npm_flags, cwd=frontend_dir).returncode == 0):
+                subprocess.run([npm, 'install'] + npm_flags, cwd=frontend_dir, check=True)
             print("   + Node.js dependencies installed")
+            # The install fallback may rewrite the lockfile, so stamp what was left behind
+            digest = fingerprint(package_lock)
+            if digest:
+                stamp.write_text(digest)
             self.success_steps.append("Frontend setup")
             return True
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
@@ -240,9 +469,19 @@ ALLOWED_EXTENSIONS=png,jpg,jpeg,gif,bmp,tiff,pdf
             'README.md'
         ]
         
+        # One directory listing per parent instead of one stat() per file
+        listings = {}
+        for directory in {os.path.dirname(file_path) for file_path in required_files}:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    listings[directory] = {entry.name for entry in entries}
+            except OSError:
+                listings[directory] = set()
+        
         all_found = True
         for file_path in required_files:
-            if not os.path.exists(file_path):
+            directory, name = os.path.split(file_path)
+            if name not in listings[directory]:
                 self.warnings.append(f"Missing file: {file_path}")
                 all_found = False
         
@@ -285,17 +524,24 @@ sys.exit(0)
         
         try:
             # Use the python from the venv
-            python_executable = Path('backend') / 'venv' / 'Scripts' / 'python' if self.is_windows else Path('backend') / 'venv' / 'bin' / 'python'
-            if not python_executable.exists():
+            python_executable = os.path.join('backend', 'venv', 'Scripts', 'python.exe') if self.is_windows else os.path.join('backend', 'venv', 'bin', 'python')
+            if not os.path.isfile(python_executable):
                 # Fallback to system python if venv not created yet
                 python_executable = sys.executable
 
-            result = subprocess.run([str(python_executable), '-c', test_script_content], capture_output=True, text=True, encoding='utf-8')
-
-            if result.returncode != 0:
-                self.warnings.append(f"Backend import issues: {result.stderr or result.stdout}")
+            # -B: no __pycache__ writes from the probe; -I: skip user site and PYTHON* env vars.
+            # stderr is merged (-u keeps it in order) and only the tail kept, so torch/spaCy
+            # warning floods stay bounded
+            with subprocess.Popen([str(python_executable), '-B', '-I', '-u', '-c', test_script_content],
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, encoding='utf-8', errors='replace') as proc:
+                tail = collections.deque(proc.stdout, maxlen=IMPORT_TEST_TAIL_LINES)
+            output = ''.join(tail)
+
+            if proc.returncode != 0:
+                self.warnings.append(f"Backend import issues: {output}")
             else:
-                print(result.stdout)
+                print(output)
                 self.success_steps.append("Backend import test")
         except Exception as e:
             self.warnings.append(f"Backend import test failed unexpectedly: {e}")
@@ -304,106 +550,40 @@ sys.exit(0)
         """Create cross-platform startup scripts"""
         print("\n>> Creating startup scripts...")
         
-        # Dev script
-        dev_script_content = """
-#!/bin/bash
-# This script starts both the Flask backend and the React frontend for development.
-
-# Function to kill all child processes
-cleanup() {
-    echo "Shutting down servers..."
-    kill 0
-}
-trap cleanup EXIT
-
-# Start backend
-echo "Starting Flask backend..."
-source backend/venv/bin/activate
-flask --app backend/app run &
-BACKEND_PID=$!
-
-# Start frontend
-echo "Starting React frontend..."
-cd frontend
-npm run dev &
-FRONTEND_PID=$!
-
-# Wait for both processes to complete
-wait $BACKEND_PID
-wait $FRONTEND_PID
-"""
-        
-        dev_script_content_win = """
-@echo off
-ECHO.
-ECHO ========================================================
-ECHO  Starting OCR Legal Document Processor
-ECHO ========================================================
-ECHO.
-ECHO This will open two new command prompt windows:
-ECHO   1. Flask Backend Server
-ECHO   2. React Frontend Server
-ECHO.
-ECHO To stop the application, simply close both of those new windows.
-ECHO.
-
-REM Start backend in a new window and keep it open
-ECHO Starting Flask backend...
-start "Flask Backend" cmd /k "cd backend && .\\venv\\Scripts\\activate && flask run"
-
-REM Start frontend in a new window and keep it open
-ECHO Starting React frontend...
-start "React Frontend" cmd /k "cd frontend && npm run dev"
-
-ECHO.
-ECHO Servers are starting up in new windows...
-"""
-
         if self.is_windows:
-            with open('start-dev.bat', 'w') as f:
-                f.write(dev_script_content_win)
+            atomic_write('start-dev.bat', DEV_SCRIPT_BAT_BYTES)
         else:
-            with open('start-dev.sh', 'w', newline='\n') as f:
-                f.write(dev_script_content)
-                os.chmod('start-dev.sh', 0o755)
+            atomic_write('start-dev.sh', DEV_SCRIPT_SH_BYTES)
+            os.chmod('start-dev.sh', 0o755)
 
         print("   + Startup scripts created")
         self.success_steps.append("Startup scripts creation")
 
     def print_summary(self):
         """Print a summary of the setup process"""
-        print(f"\n{Colors.CYAN}{Colors.BOLD}")
-        print("=" * 60)
-        print("  SETUP SUMMARY")
-        print("=" * 60)
-        print(Colors.END)
-        
-        print("\n+ SUCCESSFUL STEPS:")
-        for step in self.success_steps:
-            print(f"  - {step}")
+        # Assembled in memory and written once so it can't interleave with other output
+        buf = io.StringIO()
+        buf.write(SUMMARY_HEADER)
+        buf.write("".join(f"  - {step}\n" for step in self.success_steps))
             
         if self.warnings:
-            print(f"\n{Colors.YELLOW}! WARNINGS:{Colors.END}")
-            for warning in self.warnings:
-                print(f"  - {warning}")
+            buf.write(WARNINGS_HEADING)
+            buf.write("".join(f"  - {warning}\n" for warning in self.warnings))
         
         if self.errors:
-            print(f"\n{Colors.RED}X ERRORS:{Colors.END}")
-            for error in self.errors:
-                print(f"  - {error}")
-            
-            print(f"\n{Colors.RED}Please fix the errors above before proceeding.{Colors.END}")
+            buf.write(ERRORS_HEADING)
+            buf.write("".join(f"  - {error}\n" for error in self.errors))
+            buf.write(ERRORS_FOOTER)
         else:
-            print(f"\n{Colors.GREEN}{Colors.BOLD}🎉 Setup complete!{Colors.END}")
-            print("To start the application, run:")
-            if self.is_windows:
-                print("   start-dev.bat")
-            else:
-                print("   ./start-dev.sh")
-                
+            buf.write(SUCCESS_FOOTER_WINDOWS if self.is_windows else SUCCESS_FOOTER)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
     def run_setup(self):
         """Run the entire setup process"""
         self.print_header()
+        self.prefetch_probes()
         
         if self.check_python_version():
             if self.check_node_version():
@@ -412,16 +592,20 @@ ECHO Servers are starting up in new windows...
                 self.check_file_structure()
                 self.create_env_file()
                 
-                if self.setup_backend():
-                    try:
-                        self.setup_frontend()
-                    except Exception as e:
-                         self.errors.append(f"Unexpected error in setup_frontend: {e}")
-
+                # pip and npm stream straight to the terminal, so run them one at a time;
+                # the frontend install no longer depends on the backend succeeding
+                backend_ok = self.setup_backend()
+                try:
+                    self.setup_frontend()
+                except Exception as e:
+                    self.errors.append(f"Unexpected error in setup_frontend: {e}")
+
+                if backend_ok:
                     self.test_backend_imports()
                 
                 self.create_startup_scripts()
         
+        self.save_probe_cache()
         self.print_summary()
 
 def main():